@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Build time, memory and query latency of the fuzzy lemma name index.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/fuzzy.py [wordnet_data_dir] [n_queries]
+
+Builds the `FuzzyIndex` of a WordNet's lemma names, then looks up random
+misspellings (one random edit) of its lemma names at distance 1 and 2.
+"""
+
+import random
+import resource
+import sys
+import time
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.fuzzy import edits
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def misspellings(names, alphabet, n_queries, seed=0):
+    rng = random.Random(seed)
+    return [rng.choice(sorted(edits(name, alphabet)))
+            for name in rng.sample(names, n_queries)]
+
+
+def main(wordnet_data_dir=wordnet_30_dir, n_queries=200):
+    n_queries = int(n_queries)
+    wordnet = WordNet(wordnet_data_dir)
+    wordnet._store.lemma_pos_offset_map
+    rss = max_rss_mb()
+    start = time.perf_counter()
+    index = wordnet._store.fuzzy_index
+    print('Data directory:      {}'.format(wordnet_data_dir))
+    print('Build:               {} names in {:.2f}s, +{:.0f} MB max RSS'.format(
+        len(index), time.perf_counter() - start, max_rss_mb() - rss))
+
+    queries = misspellings(index.names, 'abcdefghijklmnopqrstuvwxyz', n_queries)
+    for max_distance in [1, 2]:
+        timings = []
+        n_matches = 0
+        for word in queries:
+            start = time.perf_counter()
+            n_matches += len(index.search(word, max_distance))
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print('max_distance={}:      median {:.2f}ms, p95 {:.2f}ms, {:.1f} matches per query'.format(
+            max_distance, timings[len(timings) // 2] * 1000,
+            timings[int(len(timings) * 0.95)] * 1000, n_matches / len(queries)))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Build time and query latency of the gloss index.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/gloss_search.py [wordnet_data_dir]
+
+Builds the `GlossIndex` of a WordNet, then runs AND, OR and phrase queries
+with `WordNet.search_glosses()` and with a scan over `all_synsets()`.
+"""
+
+import sys
+import time
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.gloss import contains_phrase, gloss_texts, tokenize
+
+QUERIES = ['dog', 'domestic animal', 'genus Canis', 'of the', 'United States', 'xyzzy']
+
+
+def scan(wordnet, query, operator):
+    tokens = tokenize(query)
+    matches = []
+    for synset in wordnet.all_synsets():
+        texts = gloss_texts(synset)
+        if operator == 'phrase':
+            found = contains_phrase(texts, tokens)
+        else:
+            words = set(tokenize(' '.join(texts)))
+            found = (all if operator == 'and' else any)(token in words for token in tokens)
+        if found:
+            matches.append(synset)
+    return matches
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(wordnet_data_dir=wordnet_30_dir):
+    wordnet = WordNet(wordnet_data_dir)
+    gloss_index, seconds = timed(wordnet.build_gloss_index)
+    print('Data directory:      {}'.format(wordnet_data_dir))
+    print('Build:               {} synsets, {} tokens in {:.2f}s'.format(
+        len(gloss_index), len(gloss_index._postings), seconds))
+    print('{:<16} {:<7} {:>7} {:>10} {:>10}'.format('query', 'op', 'matches', 'index', 'scan'))
+    for query in QUERIES:
+        for operator in ['and', 'or', 'phrase']:
+            matches, index_seconds = timed(wordnet.search_glosses, query, operator)
+            scanned, scan_seconds = timed(scan, wordnet, query, operator)
+            assert matches == scanned
+            print('{:<16} {:<7} {:>7} {:>8.2f}ms {:>8.0f}ms'.format(
+                query, operator, len(matches), index_seconds * 1000, scan_seconds * 1000))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
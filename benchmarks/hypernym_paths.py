@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Hypernym paths and depths of all synsets.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/hypernym_paths.py [wordnet_data_dir]
+
+Computes `hypernym_paths()`, `min_depth()` and `max_depth()` of every
+synset with the path engine of `Synset._init_hypernym_paths()`, and with
+the former recursion over `hypernyms()` for comparison, and checks that
+both give the same results.
+"""
+
+import sys
+import time
+from itertools import chain
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+
+
+def recursive_hypernym_paths(synset):
+    """ The paths of `synset`, walking up to the root from scratch. """
+    paths = []
+    hypernyms = synset.hypernyms() + synset.instance_hypernyms()
+    if len(hypernyms) == 0:
+        paths = [[synset]]
+    for hypernym in hypernyms:
+        for ancestor_list in recursive_hypernym_paths(hypernym):
+            ancestor_list.append(synset)
+            paths.append(ancestor_list)
+    return paths
+
+
+def engine(synsets):
+    for synset in synsets:
+        synset._hyperpaths = None
+    start = time.perf_counter()
+    for synset in synsets:
+        synset.hypernym_paths(), synset.min_depth(), synset.max_depth()
+    return time.perf_counter() - start
+
+
+def recursion(synsets):
+    """ Same as `engine()` with the former, recursive computation. """
+    start = time.perf_counter()
+    results = []
+    for synset in synsets:
+        paths = recursive_hypernym_paths(synset)
+        min_depth = min(len(path) for path in paths) - 1
+        max_depth = max(len(path) for path in paths) - 1
+        root_hypernyms = list(set([path[0] for path in paths]))
+        hypernyms_set = set(chain(*paths)) - {synset}
+        results.append((paths, min_depth, max_depth, root_hypernyms, hypernyms_set))
+    seconds = time.perf_counter() - start
+    assert all((synset.hypernym_paths(), synset.min_depth(), synset.max_depth(),
+                synset.root_hypernyms(), synset.hypernyms_set()) == result
+               for synset, result in zip(synsets, results))
+    return seconds
+
+
+def main(wordnet_data_dir=wordnet_30_dir):
+    wordnet = WordNet(wordnet_data_dir)
+    synsets = list(wordnet.all_synsets())
+    print('Data directory:      {}'.format(wordnet_data_dir))
+    seconds = engine(synsets)
+    n_paths = sum(len(synset.hypernym_paths()) for synset in synsets)
+    print('Path engine:         {} synsets, {} paths in {:.2f}s'.format(
+        len(synsets), n_paths, seconds))
+    print('Recursion:           {:.2f}s'.format(recursion(synsets)))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Memory report for the fully loaded WordNet graph.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/memory.py [wordnet_data_dir]
+
+Traces the allocations made while loading every synset and lemma with
+`tracemalloc` and reports the total and the average size per synset.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+
+
+def main(wordnet_data_dir=wordnet_30_dir):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    wordnet = WordNet(wordnet_data_dir)
+    elapsed = time.time() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_synsets = sum(1 for _ in wordnet.all_synsets())
+    n_lemmas = sum(len(ss.lemmas()) for ss in wordnet.all_synsets())
+    print('Data directory:      {}'.format(wordnet_data_dir))
+    print('Synsets / lemmas:    {} / {}'.format(n_synsets, n_lemmas))
+    print('Traced memory:       {:.1f} MB (peak {:.1f} MB)'.format(current / 2**20, peak / 2**20))
+    print('Bytes per synset:    {:.0f}'.format(current / n_synsets))
+    print('Load time (traced):  {:.1f}s'.format(elapsed))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
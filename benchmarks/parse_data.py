@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Parsing throughput of the ``data.*`` files.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/parse_data.py [wordnet_data_dir]
+
+Parses every data file line by line with `parse_wordnet_line()` and in one
+pass per file with `parse_data_buffer()`, and reports the lines per second
+of both.
+"""
+
+import io
+import os
+import sys
+import time
+
+from wn import WordNet
+from wn.constants import _FILEMAP, wordnet_30_dir
+from wn.reader import parse_data_buffer, parse_wordnet_line
+
+
+def read_data_files(wordnet_data_dir):
+    buffers = []
+    for pos_tag in _FILEMAP.values():
+        filename = os.path.join(wordnet_data_dir, 'data.{}'.format(pos_tag))
+        with io.open(filename, encoding='utf8') as fin:
+            buffers.append(fin.read())
+    return buffers
+
+
+def per_line(buffers, store):
+    n_lines = 0
+    for buffer in buffers:
+        for line in buffer.split('\n'):
+            if line.startswith(' ') or not line.strip():
+                continue
+            parse_wordnet_line(line, lexname_type=store.lexname_type, store=store)
+            n_lines += 1
+    return n_lines
+
+
+def bulk(buffers, store):
+    return sum(1 for buffer in buffers
+               for _ in parse_data_buffer(buffer, store.lexname_type, store))
+
+
+def main(wordnet_data_dir=wordnet_30_dir, repeat=3):
+    store = WordNet(wordnet_data_dir)._store
+    buffers = read_data_files(wordnet_data_dir)
+    print('Data directory:      {}'.format(wordnet_data_dir))
+    for name, parse in [('parse_wordnet_line', per_line), ('parse_data_buffer', bulk)]:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            n_lines = parse(buffers, store)
+            best = min(best, time.perf_counter() - start)
+        print('{:<20} {} lines in {:.2f}s, {:.0f} lines/s'.format(
+            name + ':', n_lines, best, n_lines / best))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
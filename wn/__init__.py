@@ -6,69 +6,116 @@
 # For license information, see LICENSE.TXT
 
 
+import gc
+import heapq
 import io
 import os
 import re
+import warnings
+from functools import partial
 from itertools import chain
-from collections import defaultdict
 
 from wn.constants import *
+from wn.gloss import GlossIndex, contains_phrase, gloss_texts, tokenize
+from wn.graph import RelationGraph
 from wn.info import InformationContentSimilarities
+from wn.lazy import DataFile, LazySynsetCache, _DATA_FILE_SUFFIX
+from wn.mapped import MappedDataFile, parse_mapped_line
 from wn.path import WordNetPaths
-from wn.morphy import morphy
+from wn.morphy import MorphyCache, build_inflection_index, morphy
 from wn.omw import OpenMultilingualWordNet
+from wn.parallel import PARALLEL_LOAD_SUPPORTED, parallel_load
 from wn.reader import fix_inconsistent_line
 from wn.reader import parse_wordnet_line
+from wn.reader import parse_data_buffer
 from wn.reader import parse_index_line
 from wn.reader import parse_lemma_pos_index
 from wn.reader import parse_sense_key
+from wn.sensekeys import split_lemma_id
+from wn.snapshot import load_snapshot, save_snapshot, synset_to_record
+from wn.store import WordNetStore, get_store, register_store, store_key
 from wn.utils import WordNetError, FakeSynset
 
 
-# Abusing builtins here but this is the only way I can think of.
-# A index that provides the file offset
-
-# Map from lemma -> pos -> synset_index -> offset
-__builtins__['_lemma_pos_offset_map'] = defaultdict(dict)
-# A cache so we don't have to reconstuct synsets
-# Map from pos -> offset -> synset
-__builtins__['_synset_offset_cache'] = defaultdict(dict)
-
-# A cache to store the wordnet data of multiple languages
-__builtins__['_lang_to_offsets_to_lemma'] = defaultdict(dict)
-__builtins__['_lang_to_lemmas_to_offsets'] = defaultdict(dict)
-
-# Map from sensekey -> count
-__builtins__['_lemmakey_to_count'] = {}
-
 __version__ = '0.0.23'
 
 class WordNet(WordNetPaths, InformationContentSimilarities, OpenMultilingualWordNet):
-    def __init__(self, wordnet_data_dir=wordnet_dir, lexname_type=None):
+    def __init__(self, wordnet_data_dir=wordnet_dir, lexname_type=None,
+                 snapshot=None, lazy=False, mmap=False, processes=None,
+                 lazy_gloss=False, morphy_cache_size=16384):
+        """
+        :param snapshot: Path to a binary snapshot (see `wn.snapshot`). If the
+        file exists and matches `wordnet_data_dir`, everything is loaded from
+        it; otherwise the text files are parsed and the snapshot is (re)built.
+        :param lazy: Only load the index files up front and parse each synset
+        from its data file the first time it's used.
+        :param mmap: Like `lazy`, but the data files are memory-mapped and
+        synsets only keep offsets into them (see `wn.mapped`).
+        :param processes: Parse the index and data files with this many worker
+        processes (see `wn.parallel`) when they have to be parsed eagerly,
+        from Python 3.7 on; older versions parse them serially.
+        :param lazy_gloss: Keep the glosses of the synsets parsed in this
+        process as they are and only split them into the definition and the
+        examples when these are used (see `wn.synset.LazyGlossSynset`).
+        :param morphy_cache_size: How many `morphy()` results this instance
+        keeps (see `wn.morphy.MorphyCache`), 0 disables the cache.
+        """
         self.wordnet_data_dir = wordnet_data_dir
         self.lexname_type = lexname_type
-        # Initializes the `_lemma_pos_offset_map` and `_pos_lemma_offset_map`
-        # from wn.constants.
-        self._load_lemma_pos_offset_map()
-        # Initializes the `_synset_offset_cache`
-        # from wn.constants.
-        self._load_all_synsets()
-        # Initialize all lemma's count.
-        self._load_all_lemma_counts()
-
-        self._synset_offset_cache = _synset_offset_cache
-        self._lemma_pos_offset_map = _lemma_pos_offset_map
-
-        self._lang_to_offsets_to_lemma = _lang_to_offsets_to_lemma
-        self._lang_to_lemmas_to_offsets = _lang_to_lemmas_to_offsets
-
-        self._lemmakey_to_count = _lemmakey_to_count
+        self.mmap = mmap
+        self.lazy = lazy or mmap
+        self.lazy_gloss = lazy_gloss and not mmap
+        self.morphy_cache = MorphyCache(morphy_cache_size)
+        if self.lazy and snapshot:
+            raise WordNetError('Snapshots hold every synset and cannot be loaded lazily.')
+
+        # Reuse the store if this data directory was already loaded the same way.
+        backend = 'mmap' if mmap else 'lazy' if lazy else 'eager'
+        if self.lazy_gloss:
+            backend += '-lazy-gloss'
+        key = store_key(wordnet_data_dir, lexname_type, backend)
+        store = get_store(key)
+        self._store = store or WordNetStore(wordnet_data_dir, lexname_type)
+
+        self._synset_offset_cache = self._store.synset_offset_cache
+        self._lemma_pos_offset_map = self._store.lemma_pos_offset_map
+
+        self._lang_to_offsets_to_lemma = self._store.lang_to_offsets_to_lemma
+        self._lang_to_lemmas_to_offsets = self._store.lang_to_lemmas_to_offsets
+
+        self._lemmakey_to_count = self._store.lemmakey_to_count
+
+        if store is not None:
+            if snapshot and not os.path.exists(snapshot):
+                self.save_snapshot(snapshot)
+            return
+        if self.lazy:
+            self._load_lemma_pos_offset_map()
+            # Install the caches that parse synsets on demand.
+            self._init_lazy_synsets()
+            self._load_all_lemma_counts()
+        elif not (snapshot and self._load_snapshot(snapshot)):
+            if processes and PARALLEL_LOAD_SUPPORTED:
+                parallel_load(self._store, processes, self.lazy_gloss)
+            else:
+                # Initializes the `_lemma_pos_offset_map` and `_pos_lemma_offset_map`
+                # from wn.constants.
+                self._load_lemma_pos_offset_map()
+                # Initializes the `_synset_offset_cache`
+                # from wn.constants.
+                self._load_all_synsets()
+            # Initialize all lemma's count.
+            self._load_all_lemma_counts()
+            if snapshot:
+                self.save_snapshot(snapshot)
+        register_store(key, self._store)
 
     def _load_lemma_pos_offset_map(self):
         for pos_tag in _FILEMAP.values():
             filename = os.path.join(self.wordnet_data_dir, 'index.{}'.format(pos_tag))
-            with io.open(filename, encoding='utf8') as fin:
-                for line in fin:
+            with self.load_report.phase('index.{}'.format(pos_tag)) as phase, \
+                 io.open(filename, encoding='utf8') as fin:
+                for phase.lines, line in enumerate(fin, 1):
                     if line.startswith(' '):
                         continue
                     try:
@@ -79,76 +126,255 @@ class WordNet(WordNetPaths, InformationContentSimilarities, OpenMultilingualWord
                         ##else:
                         raise WordNetError('Error parsing:\n{}\nfrom {}'.format(line, filename))
                     # Cache the map.
-                    _lemma_pos_offset_map[lemma][pos] = synset_offsets
+                    self._lemma_pos_offset_map[lemma][pos] = synset_offsets
                     if pos == 'a':
-                        _lemma_pos_offset_map[lemma]['s'] = synset_offsets
+                        self._lemma_pos_offset_map[lemma]['s'] = synset_offsets
 
     def _load_all_synsets(self):
         for pos_tag in _FILEMAP.values():
             filename = os.path.join(self.wordnet_data_dir, 'data.{}'.format(pos_tag))
-            with io.open(filename, encoding='utf8') as fin:
-                for line in fin:
-                    # Skip documentation and empty lines.
-                    if line.startswith(' ') or not line.strip():
-                        continue
-                    try:
-                        synset, lemmas = parse_wordnet_line(line, lexname_type=self.lexname_type)
-                        _synset_offset_cache[synset._pos][synset._offset] = synset
-                    except:
-                        err_msg = "Error parsing this line from {}:\n".format('data.{}'.format(pos_tag))
-                        raise WordNetError(err_msg + line)
+            with self.load_report.phase('data.{}'.format(pos_tag)) as phase, \
+                 io.open(filename, encoding='utf8') as fin:
+                buffer = fin.read()
+                phase.lines = buffer.count('\n')
+                for synset in parse_data_buffer(buffer, self.lexname_type, self._store,
+                                                source='data.{}'.format(pos_tag),
+                                                lazy_gloss=self.lazy_gloss):
+                    self._synset_offset_cache[synset._pos][synset._offset] = synset
+
+    def _init_lazy_synsets(self):
+        data_files = {}
+        for pos in POS_LIST:
+            suffix = _DATA_FILE_SUFFIX[pos]
+            if suffix not in data_files:
+                filename = os.path.join(self.wordnet_data_dir, 'data.{}'.format(suffix))
+                data_files[suffix] = MappedDataFile(filename) if self.mmap else DataFile(filename)
+            data_file = data_files[suffix]
+            parse_line = partial(self._parse_synset_line,
+                                 mapped_data_file=data_file if self.mmap else None)
+            cache = LazySynsetCache(pos, data_file, parse_line, self._synset_offset_cache)
+            # Keep the synsets that were already loaded.
+            cache.update(self._synset_offset_cache[pos])
+            self._synset_offset_cache[pos] = cache
+
+    def _parse_synset_line(self, line, mapped_data_file=None):
+        try:
+            if mapped_data_file is not None:
+                return parse_mapped_line(mapped_data_file, line, lexname_type=self.lexname_type,
+                                         store=self._store)
+            synset, lemmas = parse_wordnet_line(line, lexname_type=self.lexname_type,
+                                                store=self._store,
+                                                lazy_gloss=self.lazy_gloss)
+        except:
+            raise WordNetError("Error parsing this line:\n" + line)
+        return synset
+
+    @property
+    def lexnames(self):
+        return self._store.lexnames
+
+    @property
+    def load_report(self):
+        """ How long each load phase took, see `wn.report`. """
+        return self._store.load_report
+
+    @property
+    def exception_map(self):
+        return self._store.exception_map
 
     def _load_all_lemma_counts(self):
         filename = os.path.join(self.wordnet_data_dir, 'cntlist.rev')
-        with open(filename) as fin:
-            for line in fin:
+        with self.load_report.phase('cntlist.rev') as phase, open(filename) as fin:
+            for phase.lines, line in enumerate(fin, 1):
                 lemma_key, _, count = line.strip().split()
-                _lemmakey_to_count[lemma_key] = int(count)
+                self._lemmakey_to_count[lemma_key] = int(count)
+
+    def _load_snapshot(self, filename):
+        """
+        Populates the caches from a snapshot, returns False if there is no
+        usable snapshot at `filename`.
+        """
+        if not os.path.exists(filename):
+            return False
+        try:
+            with self.load_report.phase('snapshot') as phase:
+                tables = load_snapshot(filename, self.wordnet_data_dir, self.lexname_type,
+                                       store=self._store)
+                phase.lines = len(tables['synsets'])
+                gloss_index = tables.get('gloss_index')
+                if gloss_index is not None:
+                    gloss_index = GlossIndex.from_table(gloss_index)
+        except WordNetError as e:
+            warnings.warn('Ignoring snapshot {}: {}'.format(filename, e))
+            return False
+        for lemma, pos_to_offsets in tables['lemma_pos_offset_map'].items():
+            self._lemma_pos_offset_map[lemma].update(pos_to_offsets)
+        for synset in tables['synsets']:
+            self._synset_offset_cache[synset._pos][synset._offset] = synset
+        self._lemmakey_to_count.update(tables['lemmakey_to_count'])
+        if tables.get('inflection_index') is not None:
+            self._store.inflection_index = tables['inflection_index']
+        if gloss_index is not None:
+            self._store.gloss_index = gloss_index
+        return True
+
+    def save_snapshot(self, filename):
+        """
+        Writes the parsed index, synsets and lemma counts of this WordNet to
+        `filename`, to be passed as `WordNet(..., snapshot=filename)` later.
+        """
+        tables = {'lemma_pos_offset_map': dict(self._lemma_pos_offset_map),
+                  'synsets': [synset_to_record(ss) for ss in self.all_synsets()],
+                  'lemmakey_to_count': self._lemmakey_to_count,
+                  'inflection_index': self._store.inflection_index,
+                  'gloss_index': (self._store.gloss_index.to_table()
+                                  if self._store.gloss_index is not None else None)}
+        save_snapshot(filename, self.wordnet_data_dir, self.lexname_type, tables)
+
+    def build_relation_graph(self):
+        """
+        Builds the array-backed graph of all synset pointers (see `wn.graph`),
+        the relation methods and path similarities use it from then on.
+        """
+        # In lazy mode `all_synsets()` streams copies, use the cached synsets.
+        synsets = [self._synset_offset_cache[ss._pos][ss._offset] for ss in self.all_synsets()]
+        self._store.relation_graph = RelationGraph(synsets)
+        return self._store.relation_graph
+
+    def build_inflection_index(self):
+        """
+        Precomputes the base forms of the inflections `morphy()` is most
+        likely asked about (see `wn.morphy.build_inflection_index()`), which
+        then become single lookups. Saved in snapshots once built.
+        """
+        with self.load_report.phase('inflection index') as phase:
+            inflection_index = build_inflection_index(self._store)
+            phase.lines = len(inflection_index)
+        self._store.inflection_index = inflection_index
+        return inflection_index
+
+    def build_synset_index(self):
+        """
+        Precomputes `synsets()` without a part of speech for the lemma names
+        and the forms of the exception lists, which then take a single
+        lookup; morphy only runs for the other forms. Loads every synset.
+        """
+        store = self._store
+        with self.load_report.phase('synset index') as phase:
+            forms = set(self._lemma_pos_offset_map)
+            for pos in _FILEMAP:
+                forms.update(self.exception_map[pos])
+            # Not through the morphy cache, which would only be flooded.
+            lookup = partial(morphy, store=store)
+            synset_index = {}
+            for form in forms:
+                synsets = self._morphy_synsets(form, None, True, lookup)
+                # The forms without synsets are answered by morphy as well.
+                if synsets:
+                    synset_index[form] = tuple(synsets)
+            phase.lines = len(synset_index)
+        store.synset_index = synset_index
+        return synset_index
+
+    def build_gloss_index(self):
+        """
+        Builds the inverted index of the words of the definitions and
+        examples (see `wn.gloss`) that `search_glosses()` uses. Saved in
+        snapshots once built.
+        """
+        with self.load_report.phase('gloss index') as phase:
+            gloss_index = GlossIndex(self.all_synsets())
+            phase.lines = len(gloss_index)
+        self._store.gloss_index = gloss_index
+        return gloss_index
+
+    def search_glosses(self, query, operator='and'):
+        """
+        The synsets whose definition or examples have all (`operator`
+        'and') or any ('or') of the words of `query`, or all of them in a
+        row ('phrase'). Builds the gloss index when first used.
+        """
+        gloss_index = self._store.gloss_index
+        if gloss_index is None:
+            gloss_index = self.build_gloss_index()
+        tokens = tokenize(query)
+        phrase = operator == 'phrase'
+        synsets = [self.synset_from_pos_and_offset(pos, offset) for pos, offset
+                   in gloss_index.search(tokens, 'and' if phrase else operator)]
+        if phrase and len(tokens) > 1:
+            synsets = [ss for ss in synsets if contains_phrase(gloss_texts(ss), tokens)]
+        return synsets
+
+    def preload_for_fork(self, hypernym_paths=False):
+        """
+        Loads everything that is otherwise loaded on first use and then
+        freezes the garbage collector's view of the heap (`gc.freeze()`).
+        Call it in the parent of prefork workers: the collections in the
+        children then never touch the preloaded objects, so their pages
+        stay shared with the parent instead of being copied in every worker.
+        :param hypernym_paths: Also compute the hypernym paths and depths
+        of every synset (memory heavy, used by the path similarities).
+        """
+        self._store.lexnames, self._store.exception_map
+        if self.lazy: # Parse the synsets that weren't used yet.
+            for pos in POS_LIST:
+                self._synset_offset_cache[pos].load_all()
+        # Computes the sense keys and counts of the lemmas too.
+        self._store.sense_key_table
+        if hypernym_paths:
+            for pos in POS_LIST:
+                for synset in self._synset_offset_cache[pos].values():
+                    synset.hypernym_paths()
+        gc.collect()
+        # Not available before Python 3.7.
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
 
     def synset_from_pos_and_offset(self, pos, offset):
         assert pos in POS_LIST, WordNetError('Part-of-Speech should be one of this: {}'.format(POS_LIST))
         offset = int(offset)
         try:
-            return _synset_offset_cache[pos][offset]
+            return self._synset_offset_cache[pos][offset]
         except:
-            if pos == 's' and offset in _synset_offset_cache['a']:
-                return _synset_offset_cache['a'][offset]
-            if pos == 'a' and offset in _synset_offset_cache['s']:
-                return _synset_offset_cache['s'][offset]
+            if pos == 's' and offset in self._synset_offset_cache['a']:
+                return self._synset_offset_cache['a'][offset]
+            if pos == 'a' and offset in self._synset_offset_cache['s']:
+                return self._synset_offset_cache['s'][offset]
             raise WordNetError('Part-of-Speech and Offset combination not found in WordNet: {} + {}'.format(pos, offset))
 
     def synset(self, lemma_pos_index):
         # Parse the lemma_pos_index string.
-        pos, offset = parse_lemma_pos_index(lemma_pos_index)
+        pos, offset = parse_lemma_pos_index(lemma_pos_index, self._store)
         # load synset information from the appropriate file
         synset = self.synset_from_pos_and_offset(pos, offset)
         # Return the synset object.
         return synset
 
-    def synsets(self, lemma, pos=None, lang='eng', check_exceptions=True):
+    def morphy(self, form, pos=None, check_exceptions=True):
+        """ `wn.morphy.morphy()` on this WordNet, through its morphy cache. """
+        return self.morphy_cache.morphy(form, pos, check_exceptions, store=self._store)
+
+    def synsets(self, lemma, pos=None, lang='eng', check_exceptions=True, by_frequency=False):
         """
         Load all synsets with a given lemma and part of speech tag.
         If no pos is specified, all synsets for all parts of speech
         will be loaded.
         If lang is specified, all the synsets associated with the lemma name
         of that language will be returned.
+        With `by_frequency` the English synsets are ordered by the tagged
+        counts of the lemma in them, most frequent first (see
+        `wn.frequency`), instead of by part of speech and index order.
         """
         lemma = lemma.lower()
         pos_tags = POS_LIST if pos == None else [pos]
         if lang == 'eng':
-            list_of_synsets = []
-            for p in pos_tags:
-                form = morphy(lemma, p, check_exceptions)
-                for offset in _lemma_pos_offset_map[form].get(p, []):
-                    if offset in _synset_offset_cache[p]:
-                        list_of_synsets.append(_synset_offset_cache[p][offset])
-                    else:
-                        if pos == 's' and offset in _synset_offset_cache['a']:
-                            list_of_synsets.append(_synset_offset_cache['a'][offset])
-                        elif pos == 'a' and offset in _synset_offset_cache['s']:
-                            list_of_synsets.append(_synset_offset_cache['s'][offset])
-
-            return list_of_synsets
+            if by_frequency:
+                return self._ranked_synsets(lemma, pos, check_exceptions)
+            if pos is None and check_exceptions and self._store.synset_index is not None:
+                synsets = self._store.synset_index.get(lemma)
+                if synsets is not None:
+                    return list(synsets)
+            return self._morphy_synsets(lemma, pos, check_exceptions, self.morphy)
         else:
             # Tries to cache the OMW for the first time if not used before.
             self._load_lang_data(lang)
@@ -157,16 +383,205 @@ class WordNet(WordNetPaths, InformationContentSimilarities, OpenMultilingualWord
             for p in pos_tags:
                 if p == 's': # Skips the 's' tag.
                     continue
-                if lemma in _lang_to_lemmas_to_offsets[lang][p]:
-                    for offset in _lang_to_lemmas_to_offsets[lang][p][lemma]:
+                if lemma in self._lang_to_lemmas_to_offsets[lang][p]:
+                    for offset in self._lang_to_lemmas_to_offsets[lang][p][lemma]:
                         list_of_offsets.append((p, offset))
             return [self.synset_from_pos_and_offset(p, offset)
                     for p, offset in set(list_of_offsets)]
 
+    def _morphy_synsets(self, lemma, pos, check_exceptions, morphy):
+        pos_tags = POS_LIST if pos == None else [pos]
+        list_of_synsets = []
+        form = None
+        for p in pos_tags:
+            # Satellites have the same base forms as adjectives, which come
+            # right before them in `POS_LIST`.
+            if p != ADJ_SAT or pos is not None:
+                form = morphy(lemma, p, check_exceptions)
+            # `.get()` so that unknown forms aren't added to the map.
+            for offset in self._lemma_pos_offset_map.get(form, {}).get(p, []):
+                synset = self._cached_synset(p, pos, offset)
+                if synset is not None:
+                    list_of_synsets.append(synset)
+        return list_of_synsets
+
+    def _cached_synset(self, p, pos, offset):
+        # The synset at `offset` of part of speech `p` when looking up `pos`,
+        # adjectives and satellites stand in for each other if `pos` is given.
+        if offset in self._synset_offset_cache[p]:
+            return self._synset_offset_cache[p][offset]
+        if pos == 's' and offset in self._synset_offset_cache['a']:
+            return self._synset_offset_cache['a'][offset]
+        if pos == 'a' and offset in self._synset_offset_cache['s']:
+            return self._synset_offset_cache['s'][offset]
+        return None
+
+    def _ranked_synsets(self, lemma, pos, check_exceptions):
+        sense_frequencies = self._store.sense_frequencies
+        pos_tags = POS_LIST if pos == None else [pos]
+        runs = []
+        form = None
+        for p in pos_tags:
+            if p != ADJ_SAT or pos is not None:
+                form = self.morphy(lemma, p, check_exceptions)
+            offsets, counts = sense_frequencies.ranked(form, p)
+            run = []
+            for offset, count in zip(offsets, counts):
+                synset = self._cached_synset(p, pos, offset)
+                if synset is not None:
+                    run.append((count, synset))
+            if run:
+                runs.append(run)
+        if len(runs) == 1:
+            return [synset for _, synset in runs[0]]
+        # The runs are ranked already, ties go to the earlier part of speech.
+        return [synset for _, synset in heapq.merge(*runs, key=lambda count_synset: -count_synset[0])]
+
+    def first_sense(self, lemma, pos=None, check_exceptions=True):
+        """
+        The synset of `lemma` (with part of speech `pos`, if given) with
+        the highest tagged count, i.e. the most frequent sense, or None.
+        """
+        lemma = lemma.lower()
+        sense_frequencies = self._store.sense_frequencies
+        first = first_count = form = None
+        for p in POS_LIST if pos is None else [pos]:
+            if p != ADJ_SAT or pos is not None:
+                form = self.morphy(lemma, p, check_exceptions)
+            offsets, counts = sense_frequencies.ranked(form, p)
+            # Only the first synset of each run can be the most frequent.
+            for offset, count in zip(offsets, counts):
+                synset = self._cached_synset(p, pos, offset)
+                if synset is not None:
+                    if first is None or count > first_count:
+                        first, first_count = synset, count
+                    break
+        return first
+
+    def fuzzy_synsets(self, word, max_distance=1, pos=None):
+        """
+        The synsets of the lemmas within `max_distance` (at most 2) edits of
+        `word`, e.g. to look up misspelled words, those of the closest lemmas
+        first. Only lemma names are matched, there's no morphy.
+        """
+        pos_tags = POS_LIST if pos is None else [pos]
+        synsets = []
+        for distance, lemma in self._store.fuzzy_index.search(word.lower(), max_distance):
+            pos_to_offsets = self._lemma_pos_offset_map[lemma]
+            for p in pos_tags:
+                for offset in pos_to_offsets.get(p, []):
+                    # Adjectives and satellites share the offsets of a lemma,
+                    # as in `synsets()` either stands in for the other.
+                    synset = self._cached_synset(p, pos, offset)
+                    if synset is not None and synset not in synsets:
+                        synsets.append(synset)
+        return synsets
+
+    def synsets_many(self, tokens, pos=None, lang='eng', check_exceptions=True):
+        """
+        The `synsets()` of each of `tokens`, in a list aligned with them.
+        `pos` is either one part of speech (or None) for all the tokens or a
+        list with one per token. Each distinct lowercased (token, pos) pair
+        is only looked up once.
+        """
+        tokens = list(tokens)
+        if isinstance(pos, (list, tuple)):
+            if len(pos) != len(tokens):
+                raise WordNetError('{} tokens but {} parts of speech'.format(len(tokens), len(pos)))
+            pos_tags = pos
+        else:
+            pos_tags = [pos] * len(tokens)
+        lowercased = {}
+        resolved = {}
+        results = []
+        for token, token_pos in zip(tokens, pos_tags):
+            lemma = lowercased.get(token)
+            if lemma is None:
+                lemma = lowercased[token] = token.lower()
+            key = lemma, token_pos
+            synsets = resolved.get(key)
+            if synsets is None:
+                synsets = resolved[key] = self.synsets(lemma, token_pos, lang, check_exceptions)
+            # A copy for each token, so that they can be changed independently.
+            results.append(list(synsets))
+        return results
+
+    def _sense_key_pos_offset(self, sense_key):
+        try:
+            return self._store.sense_index[sense_key.lower()]
+        except KeyError:
+            # Complain about malformed keys first.
+            parse_sense_key(sense_key)
+            raise WordNetError('no sense key {!r} in WordNet'.format(sense_key))
+
     def synset_from_sense_key(self, sense_key):
-        lemma, pos, lex_id = parse_sense_key(sense_key)
-        synset_id = '.'.join([lemma, pos, lex_id])
-        return self.synset(synset_id)
+        return self.synset_from_pos_and_offset(*self._sense_key_pos_offset(sense_key))
+
+    def _built_sense_key_table(self):
+        # Building the table parses every synset, only worth it if they are
+        # all loaded anyway.
+        if self._store._sense_key_table is not None or not self.lazy:
+            return self._store.sense_key_table
+        return None
+
+    def lemma_from_key(self, sense_key):
+        sense_key_table = self._built_sense_key_table()
+        if sense_key_table is not None:
+            packed_id = sense_key_table.lemma_id(sense_key.lower())
+            if packed_id is None:
+                # Complain about malformed keys first.
+                parse_sense_key(sense_key)
+                raise WordNetError('no sense key {!r} in WordNet'.format(sense_key))
+            return self._lemma_from_id(packed_id)
+        synset = self.synset_from_sense_key(sense_key)
+        lemma = self._synset_lemma_with_key(synset, sense_key.lower())
+        if lemma is None:
+            raise WordNetError('no lemma with sense key {!r} in {}'.format(sense_key, synset))
+        return lemma
+
+    def _lemma_from_id(self, packed_id):
+        pos, offset, lemma_index = split_lemma_id(packed_id)
+        return self.synset_from_pos_and_offset(pos, offset)._lemmas[lemma_index]
+
+    @staticmethod
+    def _synset_lemma_with_key(synset, sense_key):
+        for lemma in synset._lemmas:
+            if lemma.key() == sense_key:
+                return lemma
+        return None
+
+    def synsets_from_sense_keys(self, sense_keys):
+        """
+        Resolves many sense keys at once (e.g. the annotations of a sense
+        tagged corpus), unknown keys give None instead of an error.
+        """
+        sense_index = self._store.sense_index
+        synsets = []
+        for sense_key in sense_keys:
+            pos_offset = sense_index.get(sense_key.lower())
+            synsets.append(None if pos_offset is None else
+                           self.synset_from_pos_and_offset(*pos_offset))
+        return synsets
+
+    def lemmas_from_keys(self, sense_keys):
+        """ Same as `synsets_from_sense_keys()`, for the Lemmas of the keys. """
+        sense_key_table = self._built_sense_key_table()
+        if sense_key_table is None:
+            return [None if synset is None else
+                    self._synset_lemma_with_key(synset, sense_key.lower())
+                    for sense_key, synset
+                    in zip(sense_keys, self.synsets_from_sense_keys(sense_keys))]
+        lemmas = []
+        for sense_key in sense_keys:
+            packed_id = sense_key_table.lemma_id(sense_key.lower())
+            lemmas.append(None if packed_id is None else self._lemma_from_id(packed_id))
+        return lemmas
+
+    def lemmas_with_frame(self, frame_id):
+        """ The verb lemmas that take the verb frame `frame_id`. """
+        offsets, lemma_indexes = self._store.verb_frame_index.get(frame_id, ((), ()))
+        return [self.synset_from_pos_and_offset(VERB, offset)._lemmas[lemma_index]
+                for offset, lemma_index in zip(offsets, lemma_indexes)]
 
     def all_synsets(self, pos=None):
         """Iterate over all synsets with a given part of speech tag.
@@ -176,20 +591,35 @@ class WordNet(WordNetPaths, InformationContentSimilarities, OpenMultilingualWord
         pos_tags = POS_LIST if pos is None else [pos]
 
         for _pos in pos_tags:
-            for offset, ss in _synset_offset_cache[_pos].items():
-                yield ss
+            if self.lazy: # Stream through the data file instead.
+                for ss in self._synset_offset_cache[_pos].stream():
+                    yield ss
+            else:
+                for offset, ss in self._synset_offset_cache[_pos].items():
+                    yield ss
 
     def all_lemma_names(self, pos=None, lang='eng'):
         if lang == 'eng':
-            for lemma_name in _lemma_pos_offset_map:
-                if pos in _lemma_pos_offset_map[lemma_name] or pos == None:
+            for lemma_name in self._lemma_pos_offset_map:
+                if pos in self._lemma_pos_offset_map[lemma_name] or pos == None:
                     yield lemma_name
         else:
             # Tries to cache the OMW for the first time if not used before.
             self._load_lang_data(lang)
-            for lemma_name in _lang_to_lemmas_to_offsets[lang][pos]:
+            for lemma_name in self._lang_to_lemmas_to_offsets[lang][pos]:
                 yield lemma_name
 
+    def lemma_names_with_prefix(self, prefix, pos=None, lang='eng', limit=None):
+        """
+        The lemma names of `lang` that start with `prefix` (case-insensitive)
+        in alphabetical order, optionally only those with part of speech
+        `pos` and at most `limit` of them.
+        """
+        if lang != 'eng':
+            # Checks that `lang` is supported first.
+            self._load_lang_data(lang)
+        return self._store.prefix_index(lang).search(prefix.lower(), pos, limit)
+
     def words(self, lang='lang'):
         """return lemmas of the given language as list of words"""
         return self.all_lemma_names(lang=lang)
@@ -219,7 +649,7 @@ class WordNet(WordNetPaths, InformationContentSimilarities, OpenMultilingualWord
         for ss in self.all_synsets(pos):
             try:
                 depth = max(depth, ss.max_depth())
-            except RuntimeError:
+            except WordNetError:
                 _msg = '{} throws error when searching for max_depth'.format(ss)
                 raise WordNetError(_msg)
         if simulate_root:
@@ -9,6 +9,7 @@ import os
 import re
 
 from collections import defaultdict
+from collections.abc import Mapping, Sequence
 
 ######################################################################
 # Constants
@@ -123,12 +124,13 @@ VERB_FRAME_STRINGS = (
 SENSENUM_RE = re.compile(r'\.[\d]+\.')
 
 
-def load_exception_map():
+def load_exception_map(wordnet_data_dir=None):
     # load the exception file data into memory
+    wordnet_data_dir = wordnet_data_dir or wordnet_dir
     exception_map = {}
     for pos, suffix in _FILEMAP.items():
         exception_map[pos] = {}
-        with open(wordnet_dir+'%s.exc' % suffix) as fin:
+        with open(os.path.join(wordnet_data_dir, '%s.exc' % suffix)) as fin:
             for line in fin:
                 terms = line.strip().split()
                 exception_map[pos][terms[0]] = terms[1:]
@@ -182,9 +184,10 @@ def load_lemma_pos_offset_map():
                     ##pos_lemma_offset_map[ADJ_SAT][lemma] = synset_offsets
     return lemma_pos_offset_map##, pos_lemma_offset_map
 
-def load_lexnames():
+def load_lexnames(wordnet_data_dir=None):
+    wordnet_data_dir = wordnet_data_dir or wordnet_dir
     lexnames = []
-    with open(wordnet_dir+'lexnames') as fin:
+    with open(os.path.join(wordnet_data_dir, 'lexnames')) as fin:
         # Load the lexnames
         for i, line in enumerate(fin):
             index, lexname, _ = line.split()
@@ -192,6 +195,24 @@ def load_lexnames():
             lexnames.append(lexname)
     return lexnames
 
+def load_sense_index(wordnet_data_dir=None):
+    """
+    Reads ``index.sense`` into a sense key -> (pos, offset) dictionary, or
+    returns None if the data directory doesn't have one.
+    """
+    wordnet_data_dir = wordnet_data_dir or wordnet_dir
+    filename = os.path.join(wordnet_data_dir, 'index.sense')
+    if not os.path.exists(filename):
+        return None
+    sense_index = {}
+    with open(filename) as fin:
+        # `sense_key offset sense_number tag_count`
+        for line in fin:
+            sense_key, offset, _ = line.split(' ', 2)
+            ss_type = sense_key[sense_key.index('%') + 1]
+            sense_index[sense_key] = _synset_types[int(ss_type)], int(offset)
+    return sense_index
+
 
 wn_data_dir = os.path.dirname(os.path.abspath(__file__)) + '/data/'
 wordnet_dir = wordnet_30_dir = os.path.dirname(os.path.abspath(__file__)) + '/data/wordnet-3.0/'
@@ -199,9 +220,51 @@ wordnet_dir = wordnet_30_dir = os.path.dirname(os.path.abspath(__file__)) + '/da
 
 wordnet_ic_dir = os.path.dirname(os.path.abspath(__file__)) + '/data/wordnet_ic/'
 omw_dir = os.path.dirname(os.path.abspath(__file__)) + '/data/omw/'
-exception_map = load_exception_map()
 ##lemma_pos_offset_map = load_lemma_pos_offset_map()
-lexnames = load_lexnames()
+
+class _LazyTable:
+    """
+    A table of the default `wordnet_dir`, only read by `loader` when first
+    used (`WordNet` instances load the ones of their own data directory).
+    """
+    def __init__(self, loader):
+        self._loader = loader
+        self._table = None
+
+    def _load(self):
+        if self._table is None:
+            self._table = self._loader()
+        return self._table
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __eq__(self, other):
+        return self._load() == other
+
+    def __repr__(self):
+        return repr(self._load())
+
+
+class _LazyMapping(_LazyTable, Mapping):
+    pass
+
+
+class _LazySequence(_LazyTable, Sequence):
+    pass
+
+
+exception_map = _LazyMapping(load_exception_map)
+lexnames = _LazySequence(load_lexnames)
 
 __all__ = [
 '_ENCODING',
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+The synsets of each lemma ranked by the tagged counts of ``cntlist.rev``.
+
+`SenseFrequencies` keeps the offsets of the synsets of every (lemma, pos)
+of the lemma index, most frequent first, and their counts in two parallel
+arrays. The runs of a lemma are contiguous and in the order of
+`_RANKED_POS`, so only the start of each lemma's runs is stored; their
+lengths are those of the offset lists in the lemma index. Synsets with the
+same count keep their order in the index files.
+"""
+
+from array import array
+
+from wn.constants import ADJ, ADJ_SAT, ADV, NOUN, VERB
+
+# Satellites share the offset lists of adjectives in the lemma index.
+_RANKED_POS = (NOUN, VERB, ADJ, ADV)
+
+
+class SenseFrequencies:
+    def __init__(self, lemma_pos_offset_map, counts):
+        """
+        :param counts: A (lemma, pos, offset) -> count mapping, the pos of
+        satellites being ADJ and missing entries counting 0.
+        """
+        self._lemma_pos_offset_map = lemma_pos_offset_map
+        self._offsets = array('I')
+        self._counts = array('I')
+        self._starts = {}
+        for lemma, pos_to_offsets in lemma_pos_offset_map.items():
+            self._starts[lemma] = len(self._offsets)
+            for pos in _RANKED_POS:
+                offsets = pos_to_offsets.get(pos)
+                if not offsets:
+                    continue
+                ranked = sorted(((counts.get((lemma, pos, offset), 0), offset)
+                                 for offset in offsets),
+                                # Stable, so ties stay in index order.
+                                key=lambda count_offset: -count_offset[0])
+                for count, offset in ranked:
+                    self._counts.append(count)
+                    self._offsets.append(offset)
+
+    def ranked(self, lemma, pos):
+        """
+        The (offsets, counts) of the synsets of `lemma` with part of speech
+        `pos`, most frequent first.
+        """
+        pos = ADJ if pos == ADJ_SAT else pos
+        start = self._starts.get(lemma)
+        if start is None:
+            return array('I'), array('I')
+        pos_to_offsets = self._lemma_pos_offset_map[lemma]
+        for ranked_pos in _RANKED_POS:
+            length = len(pos_to_offsets.get(ranked_pos, ()))
+            if ranked_pos == pos:
+                return (self._offsets[start:start + length],
+                        self._counts[start:start + length])
+            start += length
+        return array('I'), array('I')
+
+    def __len__(self):
+        return len(self._offsets)
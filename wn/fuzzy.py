@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Approximate lemma name lookup by edit distance.
+
+`FuzzyIndex` is a symmetric delete index: every lemma name is stored under
+itself and under each string that is one deleted character away from it.
+Two strings within edit distance 1 always share one of these, so the
+candidates for a query are found by looking up the query and its own
+deletes, and only the candidates are compared with `edit_distance()`.
+Distance 2 is answered by running the distance 1 lookup for every string
+one edit away from the query.
+
+The keys are only kept as 32 bit hashes, packed with the position of their
+lemma name into one sorted array, which takes a fraction of the memory of
+a dictionary of strings; hash collisions only add candidates that fail the
+comparison.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from wn.utils import WordNetError
+
+#: The largest `max_distance` that `FuzzyIndex.search()` supports.
+MAX_DISTANCE = 2
+
+
+def deletes(word):
+    """ The strings one deleted character away from `word`. """
+    return {word[:i] + word[i+1:] for i in range(len(word))}
+
+
+def edits(word, alphabet):
+    """ The strings one deletion, insertion or substitution away from `word`. """
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    result = {left + right[1:] for left, right in splits if right}
+    result.update(left + char + right for left, right in splits for char in alphabet)
+    result.update(left + char + right[1:] for left, right in splits if right
+                  for char in alphabet)
+    return result
+
+
+def edit_distance(word1, word2, max_distance):
+    """
+    The Levenshtein distance between `word1` and `word2`, or
+    `max_distance` + 1 as soon as it is known to be larger than that.
+    """
+    if abs(len(word1) - len(word2)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(word2) + 1))
+    for i, char1 in enumerate(word1, 1):
+        current = [i]
+        for j, char2 in enumerate(word2, 1):
+            current.append(min(previous[j] + 1, current[j-1] + 1,
+                               previous[j-1] + (char1 != char2)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def _key_hash(key):
+    return hash(key) & 0xffffffff
+
+
+class FuzzyIndex:
+    def __init__(self, names):
+        self.names = sorted(names)
+        self.alphabet = sorted(set().union(*self.names))
+        # The 32 bit hash of each key in the high half, the position of its
+        # name in the low half.
+        self._entries = array('Q', sorted((_key_hash(key) << 32) | name_id
+                                          for name_id, name in enumerate(self.names)
+                                          for key in deletes(name) | {name}))
+
+    def _candidates(self, keys):
+        entries = self._entries
+        candidates = set()
+        for key in keys:
+            key_hash = _key_hash(key)
+            i = bisect_left(entries, key_hash << 32)
+            while i < len(entries) and entries[i] >> 32 == key_hash:
+                candidates.add(entries[i] & 0xffffffff)
+                i += 1
+        return candidates
+
+    def search(self, word, max_distance=1):
+        """
+        The (distance, name) of the names within `max_distance` edits of
+        `word`, closest and then alphabetically first.
+        """
+        if not 0 <= max_distance <= MAX_DISTANCE:
+            raise WordNetError('max_distance must be between 0 and {}'.format(MAX_DISTANCE))
+        queries = {word}
+        if max_distance == 2:
+            queries |= edits(word, self.alphabet)
+        keys = set(queries)
+        if max_distance:
+            for query in queries:
+                keys |= deletes(query)
+        matches = []
+        for name_id in self._candidates(keys):
+            name = self.names[name_id]
+            distance = edit_distance(word, name, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, name))
+        return sorted(matches)
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Full-text search over the definitions and examples of synsets.
+
+A `GlossIndex` maps each token of the glosses to the sorted ids of the
+synsets that use it, the id of a synset being its position in the order
+the index was built in. AND queries intersect the posting lists, shortest
+first, and OR queries merge them; phrase queries are the AND of their
+tokens, checked against the text of the matching synsets with
+`contains_phrase()`, which is cheaper than storing token positions.
+"""
+
+import re
+import sys
+from array import array
+from bisect import bisect_left
+
+from wn.utils import WordNetError
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """ The lowercased word tokens of `text`, as they are indexed. """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def gloss_texts(synset):
+    """ The definition and the examples of `synset`. """
+    return [synset._definition] + list(synset._examples)
+
+
+def contains_phrase(texts, tokens):
+    """ Whether the `tokens` follow each other in one of `texts`. """
+    n_tokens = len(tokens)
+    for text in texts:
+        text_tokens = tokenize(text)
+        for i in range(len(text_tokens) - n_tokens + 1):
+            if text_tokens[i:i + n_tokens] == tokens:
+                return True
+    return False
+
+
+def _intersect(ids, posting):
+    # Probe the posting list for each id if it's much longer than them.
+    if len(ids) * 16 < len(posting):
+        result = []
+        for synset_id in ids:
+            i = bisect_left(posting, synset_id)
+            if i < len(posting) and posting[i] == synset_id:
+                result.append(synset_id)
+        return result
+    return sorted(set(ids).intersection(posting))
+
+
+class GlossIndex:
+    def __init__(self, synsets=()):
+        """
+        :param synsets: The synsets to index, iterated once.
+        """
+        self._pos = []
+        self._offsets = array('I')
+        self._postings = {}
+        postings = self._postings
+        for synset_id, synset in enumerate(synsets):
+            self._pos.append(synset._pos)
+            self._offsets.append(synset._offset)
+            tokens = set()
+            for text in gloss_texts(synset):
+                tokens.update(tokenize(text))
+            for token in tokens:
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = array('I')
+                posting.append(synset_id)
+        self._pos = ''.join(self._pos)
+
+    def _key(self, synset_id):
+        return self._pos[synset_id], self._offsets[synset_id]
+
+    def search(self, tokens, operator='and'):
+        """
+        The (pos, offset) of the synsets whose glosses have all (`operator`
+        'and') or any ('or') of `tokens`, in the order they were indexed.
+        """
+        if operator not in ('and', 'or'):
+            raise WordNetError("operator must be 'and' or 'or', not {!r}".format(operator))
+        postings = [self._postings.get(token, ()) for token in set(tokens)]
+        if not postings:
+            return []
+        if operator == 'and':
+            postings.sort(key=len)
+            ids = postings[0]
+            for posting in postings[1:]:
+                if not ids:
+                    break
+                ids = _intersect(ids, posting)
+        else:
+            ids = sorted(set().union(*postings))
+        return [self._key(synset_id) for synset_id in ids]
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def to_table(self):
+        """
+        The index as plain bytes and strings, for snapshots. The arrays are
+        dumped in the machine's layout, which is recorded with them.
+        """
+        return {'itemsize': self._offsets.itemsize,
+                'byteorder': sys.byteorder,
+                'pos': self._pos,
+                'offsets': self._offsets.tobytes(),
+                'postings': {token: posting.tobytes()
+                             for token, posting in self._postings.items()}}
+
+    @classmethod
+    def from_table(cls, table):
+        """
+        Rebuilds the index from `to_table()`, byte-swapping the arrays of
+        a machine of the other byte order. Raises WordNetError for a table
+        whose integers don't have the size of this machine's.
+        """
+        index = cls()
+        if table.get('itemsize') != index._offsets.itemsize:
+            raise WordNetError('Gloss index of {}-byte integers, expected {}-byte'.format(
+                               table.get('itemsize'), index._offsets.itemsize))
+        swap = table.get('byteorder') != sys.byteorder
+        index._pos = table['pos']
+        index._offsets.frombytes(table['offsets'])
+        if swap:
+            index._offsets.byteswap()
+        for token, posting in table['postings'].items():
+            posting = index._postings[token] = array('I', posting)
+            if swap:
+                posting.byteswap()
+        return index
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Array-backed relation graph over all synsets.
+
+Every synset gets a dense integer id and every pointer symbol gets one
+adjacency in compressed sparse row (CSR) form: the targets of node `i` are
+`indices[indptr[i]:indptr[i+1]]`. The targets of each row are stored in the
+order `Synset._related()` returns them, so relation lookups don't sort and
+graph traversals only touch integers.
+"""
+
+from array import array
+from collections import defaultdict, deque
+
+from wn.constants import ADJ, ADJ_SAT
+
+# Typecode of the indptr/indices arrays.
+_INDEX_TYPECODE = 'i'
+
+# The is-a relations followed when walking up to the root.
+_HYPERNYM_SYMBOLS = ('@', '@i')
+
+
+class RelationGraph:
+    def __init__(self, synsets):
+        # Map from id -> synset and from (pos, offset) -> id.
+        self.synsets = list(synsets)
+        self.ids = {(ss._pos, ss._offset): i for i, ss in enumerate(self.synsets)}
+
+        # Map from symbol -> source id -> target ids.
+        edges = defaultdict(lambda: defaultdict(list))
+        for source_id, ss in enumerate(self.synsets):
+            for symbol, targets in ss._packed_pointers:
+                target_ids = [self._resolve(pos, offset) for pos, offset in targets]
+                # Same order as `Synset._related()` would sort them.
+                target_ids.sort(key=lambda target_id: self.synsets[target_id]._name)
+                edges[symbol][source_id] = target_ids
+
+        # Map from symbol -> (indptr, indices)
+        self.relations = {}
+        n_nodes = len(self.synsets)
+        for symbol, rows in edges.items():
+            indptr = array(_INDEX_TYPECODE, [0])
+            indices = array(_INDEX_TYPECODE)
+            for source_id in range(n_nodes):
+                indices.extend(rows.get(source_id, ()))
+                indptr.append(len(indices))
+            self.relations[symbol] = (indptr, indices)
+
+    def _resolve(self, pos, offset):
+        """ Pointers don't always tell adjectives and satellites apart. """
+        if pos in (ADJ, ADJ_SAT):
+            return self.ids.get((ADJ, offset), self.ids.get((ADJ_SAT, offset)))
+        return self.ids[pos, offset]
+
+    def __len__(self):
+        return len(self.synsets)
+
+    def __contains__(self, synset):
+        # Also used to rule out the `FakeSynset` root.
+        key = getattr(synset, '_pos', None), getattr(synset, '_offset', None)
+        return key in self.ids
+
+    def id(self, synset):
+        return self.ids[synset._pos, synset._offset]
+
+    def neighbors(self, node_id, symbol):
+        """ The target ids of `node_id` under the pointer `symbol`. """
+        if symbol not in self.relations:
+            return ()
+        indptr, indices = self.relations[symbol]
+        return indices[indptr[node_id]:indptr[node_id+1]]
+
+    def related(self, synset, symbol):
+        """ Same as `synset._related(symbol)`, without any sorting. """
+        synsets = self.synsets
+        return [synsets[target_id] for target_id in self.neighbors(self.id(synset), symbol)]
+
+    def hypernym_distances(self, node_id):
+        """
+        Breadth-first walk up the hypernym and instance hypernym relations,
+        returns the shortest distance from `node_id` to each ancestor
+        (including itself at 0).
+        """
+        relations = [self.relations[symbol] for symbol in _HYPERNYM_SYMBOLS
+                     if symbol in self.relations]
+        distances = {node_id: 0}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            depth = distances[current] + 1
+            for indptr, indices in relations:
+                for target_id in indices[indptr[current]:indptr[current+1]]:
+                    if target_id not in distances:
+                        distances[target_id] = depth
+                        queue.append(target_id)
+        return distances
+
+    def shortest_path_distance(self, synset1, synset2, simulate_root=False):
+        """
+        Same as `WordNetPaths.shortest_path_distance()`, computed on the ids.
+        """
+        if synset1 == synset2:
+            return 0
+        distances1 = self.hypernym_distances(self.id(synset1))
+        distances2 = self.hypernym_distances(self.id(synset2))
+        path_distance = None
+        if simulate_root:
+            # The fake root sits one above the furthest ancestor of each.
+            path_distance = max(distances1.values()) + max(distances2.values()) + 2
+        for node_id, d1 in distances1.items():
+            d2 = distances2.get(node_id)
+            if d2 is not None and (path_distance is None or d1 + d2 < path_distance):
+                path_distance = d1 + d2
+        return path_distance
@@ -10,6 +10,7 @@ from collections import defaultdict
 
 from wn.constants import wordnet_ic_dir
 from wn.reader import parse_wordnet_ic_line
+from wn.report import LoadReport
 from wn.utils import WordNetError
 
 
@@ -29,9 +30,12 @@ class WordNetInformationContent:
                                                 self.with_add1)
 
         self.ic = defaultdict(dict)
-        with open(wordnet_ic_dir + self.ic_filename) as fin:
+        # How long reading the IC file took, see `wn.report`.
+        self.load_report = LoadReport()
+        with self.load_report.phase(self.ic_filename.lstrip('/')) as phase, \
+             open(wordnet_ic_dir + self.ic_filename) as fin:
             next(fin) # Skip the first line.
-            for line in fin:
+            for phase.lines, line in enumerate(fin, 1):
                 offset, value, pos, has_root = parse_wordnet_ic_line(line)
                 if has_root:
                     self.ic[pos][0] = self.ic[pos].get(0, 0) + value
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+On-demand synset loading.
+
+The ``data.*`` files are indexed by byte offset, so instead of parsing all
+of them up front, a synset can be read by seeking to its offset and parsing
+that single line the first time it's asked for.
+"""
+
+import io
+import threading
+
+from wn.constants import ADJ, ADJ_SAT, _FILEMAP
+
+# Satellite adjectives live in the adjective data file.
+_DATA_FILE_SUFFIX = dict(_FILEMAP)
+_DATA_FILE_SUFFIX[ADJ_SAT] = _FILEMAP[ADJ]
+
+
+class DataFile:
+    """
+    Random access to the lines of a ``data.*`` file by byte offset. The file
+    is opened on the first lookup and kept open until `close()`, the end of
+    a ``with`` block or the garbage collection of the DataFile.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self._fin = None
+        self._lock = threading.Lock()
+
+    def line_at(self, offset):
+        """
+        Returns the line that starts at `offset`, or None if no synset
+        line starts there.
+        """
+        with self._lock:
+            if self._fin is None:
+                self._fin = io.open(self.filename, 'rb')
+            self._fin.seek(offset)
+            line = self._fin.readline()
+        # Offsets pointing into the license header or the middle of a
+        # line don't start with their own zero-padded offset.
+        if not line.startswith(b'%08d ' % offset):
+            return None
+        return line.decode('utf8')
+
+    def __iter__(self):
+        """ Yields the synset lines in file order. """
+        with io.open(self.filename, encoding='utf8') as fin:
+            for line in fin:
+                # Skip documentation and empty lines.
+                if line.startswith(' ') or not line.strip():
+                    continue
+                yield line
+
+    def close(self):
+        with self._lock:
+            if self._fin is not None:
+                self._fin.close()
+                self._fin = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+class LazySynsetCache(dict):
+    """
+    The offset -> Synset mapping of one part of speech in
+    `_synset_offset_cache`, which parses synsets from the data file on the
+    first lookup of their offset.
+
+    Adjectives and satellite adjectives share ``data.adj``, so a lookup may
+    parse a synset that belongs to the other one; it is then stored in the
+    sibling cache and the lookup misses.
+    """
+    def __init__(self, pos, data_file, parse_line, synset_offset_cache):
+        super().__init__()
+        self._pos = pos
+        self._data_file = data_file
+        self._parse_line = parse_line
+        self._synset_offset_cache = synset_offset_cache
+
+    def _load(self, offset):
+        if self._pos in (ADJ, ADJ_SAT):
+            sibling = self._synset_offset_cache[ADJ_SAT if self._pos == ADJ else ADJ]
+            if dict.__contains__(sibling, offset):
+                return None
+        line = self._data_file.line_at(offset)
+        if line is None:
+            return None
+        synset = self._parse_line(line)
+        if synset._pos == self._pos:
+            self[offset] = synset
+            return synset
+        dict.__setitem__(self._synset_offset_cache[synset._pos], offset, synset)
+        return None
+
+    def __missing__(self, offset):
+        synset = self._load(offset)
+        if synset is None:
+            raise KeyError(offset)
+        return synset
+
+    def __contains__(self, offset):
+        return dict.__contains__(self, offset) or self._load(offset) is not None
+
+    def get(self, offset, default=None):
+        try:
+            return self[offset]
+        except KeyError:
+            return default
+
+    def load_all(self):
+        """ Parses and caches every synset of this part of speech. """
+        for line in self._data_file:
+            offset, _, pos, _ = line.split(' ', 3)
+            offset = int(offset)
+            if pos == self._pos and not dict.__contains__(self, offset):
+                self[offset] = self._parse_line(line)
+
+    def stream(self):
+        """
+        Yields every synset of this part of speech in file order. Synsets
+        that are already cached are reused, the others are parsed without
+        being added to the cache.
+        """
+        for line in self._data_file:
+            offset, _, pos, _ = line.split(' ', 3)
+            if pos != self._pos:
+                continue
+            offset = int(offset)
+            if dict.__contains__(self, offset):
+                yield dict.__getitem__(self, offset)
+            else:
+                yield self._parse_line(line)
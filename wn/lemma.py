@@ -5,13 +5,69 @@
 # URL: <http://nltk.org/>
 # For license information, see LICENSE.TXT
 
-from wn.constants import _pos_numbers
+from wn.constants import _pos_numbers, VERB_FRAME_STRINGS
 from wn.utils import WordNetObject
 
+def pack_lemma_pointers(lemma_name, lemma_pointers):
+    """
+    Packs the entries of lemma `lemma_name` in the synset's shared
+    `(lemma_name, symbol) -> targets` dictionary into a tuple of
+    `(symbol, tuple(targets))` pairs. Already packed pointers are returned
+    as they are.
+    """
+    if not lemma_pointers:
+        return ()
+    if isinstance(lemma_pointers, tuple):
+        return lemma_pointers
+    return tuple((symbol, tuple(targets))
+                 for (source_name, symbol), targets in lemma_pointers.items()
+                 if source_name == lemma_name)
+
+
+def satellite_head(synset):
+    """
+    The first lemma of the head synset of the satellite `synset`, whose name
+    and lex id are part of the sense keys of the satellite's lemmas.
+    """
+    # The first of the sorted `similar_tos()`, without sorting them.
+    return min(synset._related('&', sort=False))._lemmas[0]
+
+
+def format_sense_key(lemma, head_lemma=None):
+    """ The sense key of `lemma`, `head_lemma` is its `satellite_head()`. """
+    if head_lemma is not None:
+        head_name = head_lemma._name
+        head_id = '%02d' % int(head_lemma._lex_id)
+    else:
+        head_name = head_id = ''
+    sense_key_tuple = (lemma._name, _pos_numbers[lemma._synset_pos],
+                       int(lemma._lexname_index), int(lemma._lex_id),
+                       head_name, head_id)
+    return ('%s%%%d:%02d:%02d:%s:%s' % sense_key_tuple).lower()
+
+
 class Lemma(WordNetObject):
+    __slots__ = ('_name', '_syntactic_marker', '_lexname_index', '_lex_id',
+                 '_lang', '_synset_offset', '_synset_pos', '_synset_name',
+                 '_packed_pointers',
+                 # The verb frame numbers, one byte each.
+                 '_frame_ids',
+                 # Set by the Synset this lemma belongs to.
+                 '_synset',
+                 # Computed on the fly.
+                 '_key', '_count')
+
     def __init__(self, name, lexname_index, lex_id, syntactic_marker,
                  synset_offset=None, synset_pos=None,
-                 synset_name=None, lemma_pointers=None, lang='eng'):
+                 synset_name=None, lemma_pointers=None, lang='eng',
+                 frame_ids=b''):
+        """
+        :param lemma_pointers: The `(lemma_name, symbol) -> targets`
+        dictionary shared by the lemmas of the synset, or this lemma's
+        pointers already packed by `pack_lemma_pointers()`.
+        :param frame_ids: The numbers of the verb frames of this lemma, as
+        bytes (see `wn.reader.parse_verb_frame_tokens()`).
+        """
         self._name = name
         self._syntactic_marker = syntactic_marker
         self._lexname_index = lexname_index
@@ -20,51 +76,38 @@ class Lemma(WordNetObject):
         self._synset_offset = synset_offset
         self._synset_pos = synset_pos
         self._synset_name = synset_name
-        self._lemma_pointers = lemma_pointers
-        ##self._frame_strings = []
-        ##self._frame_ids = []
+        self._packed_pointers = pack_lemma_pointers(name, lemma_pointers)
+        self._frame_ids = frame_ids
+        self._synset = self._key = self._count = None
 
     def synset(self):
-        if hasattr(self, '_synset'):
-            return self._synset
-        else: # Fetch the synset from `_synset_offset_cache`
-            self._synset = _synset_offset_cache[self._synset_pos][self._synset_offset]
         return self._synset
 
     def key(self):
         """
         This function can only be used after wordnet has been initialized after
-        `_synset_offset_cache` has been populated and lemma can access the
+        the synset cache has been populated and lemma can access the
         synsets' pos.
 
         From NLTK:
             # set sense keys for Lemma objects - note that this has to be
             # done afterwards so that the relations are available
+
+        The keys of all lemmas are set at once by building the store's
+        `sense_key_table`.
         """
-        if hasattr(self, '_key'):
-            return self._key
-        if self._synset_pos == 's':
-            ss = _synset_offset_cache[self._synset_pos][self._synset_offset]
-            head_lemma = ss.similar_tos()[0]._lemmas[0]
-            head_name = head_lemma._name
-            head_id = '%02d' % int(head_lemma._lex_id)
-        else:
-            head_name = head_id = ''
-        sense_key_tuple = (self._name, _pos_numbers[self._synset_pos],
-                           int(self._lexname_index), int(self._lex_id),
-                           head_name, head_id)
-        self._key = ('%s%%%d:%02d:%02d:%s:%s' % sense_key_tuple).lower()
+        if self._key is None:
+            head_lemma = satellite_head(self._synset) if self._synset_pos == 's' else None
+            self._key = format_sense_key(self, head_lemma)
         return self._key
 
     def count(self):
-        if hasattr(self, '_count'):
+        if self._count is not None:
             return self._count
         if self._lang != 'eng':
             self._count = 0
-        elif self.key() not in _lemmakey_to_count:
-            self._count = 0
         else:
-            self._count = _lemmakey_to_count[self.key()]
+            self._count = self._synset._store.lemmakey_to_count.get(self.key(), 0)
         return self._count
 
     def name(self):
@@ -74,10 +117,10 @@ class Lemma(WordNetObject):
         return self._syntactic_marker
 
     def frame_strings(self):
-        return self._frame_strings
+        return [VERB_FRAME_STRINGS[frame_id] % self._name for frame_id in self._frame_ids]
 
     def frame_ids(self):
-        return self._frame_ids
+        return list(self._frame_ids)
 
     def lang(self):
         return self._lang
@@ -96,11 +139,11 @@ class Lemma(WordNetObject):
         return self._related('\\')
 
     def _related(self, relation_symbol):
-        if (self._name, relation_symbol) not in self._lemma_pointers:
-            return []
-        return [
-            _synset_offset_cache[pos][offset]._lemmas[lemma_index]
-            for pos, offset, lemma_index in self._lemma_pointers[
-                self._name, relation_symbol
-            ]
-        ]
+        synset_offset_cache = self._synset._store.synset_offset_cache
+        for symbol, targets in self._packed_pointers:
+            if symbol == relation_symbol:
+                return [
+                    synset_offset_cache[pos][offset]._lemmas[lemma_index]
+                    for pos, offset, lemma_index in targets
+                ]
+        return []
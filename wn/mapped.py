@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Memory-mapped data file backend.
+
+The ``data.*`` files are mapped read-only into memory and each synset only
+keeps the byte spans of its line; the definition, examples and pointers are
+decoded from the mapping and parsed the first time they are accessed.
+Processes that map the same files share the pages in the OS page cache
+instead of each holding their own copy of the glosses and pointers of the
+synsets they never use.
+"""
+
+import io
+import mmap
+
+from wn.lemma import Lemma
+from wn.reader import make_lexname, make_synset_name, parse_lemma_tokens
+from wn.reader import parse_synset_columns
+from wn.store import default_store
+from wn.synset import BaseSynset, pack_pointers
+from wn.utils import split_gloss
+
+
+class MappedDataFile:
+    """ A ``data.*`` file mapped read-only into memory. """
+    def __init__(self, filename):
+        self.filename = filename
+        with io.open(filename, 'rb') as fin:
+            self.mapping = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        # Decoding slices of the view doesn't copy them out of the mapping.
+        self.view = memoryview(self.mapping)
+
+    def line_end(self, offset):
+        end = self.mapping.find(b'\n', offset)
+        return len(self.mapping) if end < 0 else end
+
+    def decode(self, start, end):
+        return str(self.view[start:end], 'utf8')
+
+    def line_at(self, offset):
+        """
+        Returns the line that starts at `offset`, or None if no synset
+        line starts there.
+        """
+        # Offsets pointing into the license header or the middle of a
+        # line don't start with their own zero-padded offset.
+        if self.view[offset:offset+9] != b'%08d ' % offset:
+            return None
+        return self.decode(offset, self.line_end(offset)+1)
+
+    def __iter__(self):
+        """ Yields the synset lines in file order. """
+        start, size = 0, len(self.mapping)
+        while start < size:
+            end = self.line_end(start) + 1
+            # Skip documentation and empty lines.
+            if self.mapping[start:start+1].isdigit():
+                yield self.decode(start, end)
+            start = end
+
+    def close(self):
+        self.view.release()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class MappedSynset(BaseSynset):
+    """
+    A Synset that keeps the byte spans of its line in a MappedDataFile
+    instead of the parsed gloss and pointers, which are only parsed (once)
+    when used.
+    """
+    __slots__ = ('_data_file', '_columns_end', '_line_end',
+                 # See `_parse_columns()`.
+                 '_columns',
+                 # The (definition, examples), once split.
+                 '_gloss')
+
+    def __init__(self, data_file, offset, pos, name, lexname,
+                 columns_end, line_end, store):
+        BaseSynset.__init__(self, offset, pos, name, lexname, [], store)
+        self._data_file = data_file
+        # The line is `columns | gloss`, the columns end at the `|`.
+        self._columns_end = columns_end
+        self._line_end = line_end
+        self._columns = self._gloss = None
+
+    def _split_gloss(self):
+        if self._gloss is None:
+            gloss = self._data_file.decode(self._columns_end+1, self._line_end).rstrip()
+            self._gloss = split_gloss(gloss)
+        return self._gloss
+
+    def _parse_columns(self):
+        """
+        The packed synset pointers, the `lemma_name -> symbol -> targets`
+        lemma pointers, and the verb frames of the synset and of each lemma,
+        see `wn.reader.parse_synset_columns()`.
+        """
+        if self._columns is None:
+            columns_str = self._data_file.decode(self._offset, self._columns_end)
+            offset, lexname_index, pos, n_lemmas, *the_rest = columns_str.split()
+            synset_pointers, lemma_pointers, frame_ids, lemma_frame_ids = parse_synset_columns(
+                the_rest, [lemma._name for lemma in self._lemmas])
+            self._columns = (pack_pointers(synset_pointers), lemma_pointers,
+                             frame_ids, lemma_frame_ids)
+        return self._columns
+
+    @property
+    def _definition(self):
+        return self._split_gloss()[0]
+
+    @property
+    def _examples(self):
+        return self._split_gloss()[1]
+
+    @property
+    def _packed_pointers(self):
+        return self._parse_columns()[0]
+
+    @property
+    def _frame_ids(self):
+        return self._parse_columns()[2]
+
+
+class MappedLemma(Lemma):
+    """
+    A Lemma of a MappedSynset, its pointers are parsed from the synset's
+    line when used.
+    """
+    __slots__ = ()
+
+    def __init__(self, synset, name, lexname_index, lex_id, syntactic_marker):
+        self._name = name
+        self._syntactic_marker = syntactic_marker
+        self._lexname_index = lexname_index
+        self._lex_id = lex_id
+        self._lang = 'eng'
+        self._synset_offset = synset._offset
+        self._synset_pos = synset._pos
+        self._synset_name = synset._name
+        self._synset = synset
+        self._key = self._count = None
+
+    def __repr__(self):
+        return "%s('%s.%s')" % (Lemma.__name__, self._synset_name, self._name)
+
+    @property
+    def _packed_pointers(self):
+        return pack_pointers(self._synset._parse_columns()[1].get(self._name))
+
+    @property
+    def _frame_ids(self):
+        lemma_index = next(i for i, lemma in enumerate(self._synset._lemmas) if lemma is self)
+        return self._synset._parse_columns()[3][lemma_index]
+
+
+def parse_mapped_line(data_file, wordnet_line, lexname_type=None, store=None):
+    """
+    Builds the MappedSynset for a line of `data_file`, only the first columns
+    and the lemmas are parsed.
+    """
+    store = store or default_store()
+    columns_str = wordnet_line[:wordnet_line.index('|')]
+    # The first 4 columns.
+    offset, lexname_index, pos, n_lemmas, *the_rest = columns_str.split()
+    offset = int(offset)
+    lexname_index = int(lexname_index)
+    n_lemmas = int(n_lemmas, 16)
+
+    # The next `n_lemmas` * 2 terms are lemmas.
+    lemmas = parse_lemma_tokens(the_rest[:n_lemmas*2], lexname_index,
+                                store.lemma_pos_offset_map)
+    # First lemma name is the synset name.
+    synset_name = make_synset_name(lemmas[0][0], pos, offset,
+                                   store.lemma_pos_offset_map)
+    _lexname = make_lexname(lexname_index, lexname_type, store)
+
+    mapping = data_file.mapping
+    line_end = data_file.line_end(offset)
+    columns_end = mapping.find(b'|', offset, line_end)
+    synset = MappedSynset(data_file, offset, pos, synset_name, _lexname,
+                          columns_end, line_end, store)
+    synset._lemmas.extend(MappedLemma(synset, *lemma) for lemma in lemmas)
+    return synset
@@ -7,33 +7,90 @@
 
 """ Morphy: adapted from Oliver Steele's pywordnet """
 
-from itertools import chain, islice
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import chain
 
 from wn.constants import *
+from wn.store import default_store
 
-def morphy(form, pos=None, check_exceptions=True):
+MorphyCacheInfo = namedtuple('MorphyCacheInfo', ['hits', 'misses', 'evictions',
+                                                 'maxsize', 'currsize'])
+
+def morphy(form, pos=None, check_exceptions=True, store=None):
     """
     Find a possible base form for the given form, with the given
     part of speech, by checking WordNet's list of exceptional
     forms, and by recursively stripping affixes for this part of
     speech until a form in WordNet is found.
+    `store` is the WordNetStore to look the forms up in, that of the default
+    data directory (see `wn.store.default_store()`) by default.
     """
+    store = store or default_store()
 
     if pos is None:
-        morphy = _morphy
-        analyses = chain(a for p in POS_LIST for a in morphy(form, p))
+        analyses = chain(a for p in POS_LIST for a in _analyses(form, p, True, store))
     else:
-        analyses = _morphy(form, pos, check_exceptions)
+        analyses = _analyses(form, pos, check_exceptions, store)
 
     # get the first one we find
-    first = list(islice(analyses, 1))
-    if len(first) == 1:
-        return first[0]
-    else:
-        return None
+    for analysis in analyses:
+        return analysis
+    return None
+
 
+# The position of each pos in the entries of the inflection index,
+# satellites have the same rules, exceptions and lemmas as adjectives.
+_INFLECTION_SLOTS = {NOUN: 0, VERB: 1, ADJ: 2, ADJ_SAT: 2, ADV: 3}
 
-def _morphy(form, pos, check_exceptions=True):
+def _analyses(form, pos, check_exceptions, store):
+    """ `_morphy()`, answered from the store's inflection index if possible. """
+    if check_exceptions and store.inflection_index is not None:
+        base_forms = store.inflection_index.get(form)
+        if base_forms is not None:
+            return base_forms[_INFLECTION_SLOTS[pos]]
+    return _morphy(form, pos, check_exceptions, store)
+
+
+def build_inflection_index(store):
+    """
+    Precomputes `_morphy()` (with the exception lists) for the forms it is
+    most likely asked about: the exceptions, the lemmas and the forms one
+    suffix rule away from a lemma. Returns a form -> base forms per pos map
+    (in the order of `_INFLECTION_SLOTS`), `morphy()` falls back to
+    `_morphy()` for the forms that aren't in it.
+    """
+    lemma_pos_offset_map = store.lemma_pos_offset_map
+    slots = sorted(set(_INFLECTION_SLOTS.values()))
+    slot_pos = {slot: pos for pos, slot in _INFLECTION_SLOTS.items() if pos != ADJ_SAT}
+    forms = set()
+    for pos in slot_pos.values():
+        forms.update(store.exception_map[pos])
+        for lemma, pos_to_offsets in lemma_pos_offset_map.items():
+            if pos not in pos_to_offsets:
+                continue
+            forms.add(lemma)
+            # The inverse of each suffix rule.
+            for old, new in MORPHOLOGICAL_SUBSTITUTIONS[pos]:
+                if lemma.endswith(new):
+                    forms.add(lemma[:len(lemma) - len(new)] + old)
+
+    # Share the lemma strings and the results instead of keeping copies.
+    lemma_names = {lemma: lemma for lemma in lemma_pos_offset_map}
+    results = {(): ()}
+    inflection_index = {}
+    for form in forms:
+        entry = []
+        for slot in slots:
+            base_forms = tuple(lemma_names[base_form] for base_form
+                               in _morphy(form, slot_pos[slot], True, store))
+            entry.append(results.setdefault(base_forms, base_forms))
+        entry = tuple(entry)
+        inflection_index[form] = results.setdefault(entry, entry)
+    return inflection_index
+
+
+def _morphy(form, pos, check_exceptions=True, store=None):
     # from jordanbg:
     # Given an original string x
     # 1. Apply rules once to the input to get y1, y2, y3, etc.
@@ -41,7 +98,9 @@ def _morphy(form, pos, check_exceptions=True):
     # 3. If there are no matches, keep applying rules until you either
     #    find a match or you can't go any further
 
-    exceptions = exception_map[pos]
+    store = store or default_store()
+    lemma_pos_offset_map = store.lemma_pos_offset_map
+    exceptions = store.exception_map[pos]
     substitutions = MORPHOLOGICAL_SUBSTITUTIONS[pos]
 
     def apply_rules(forms):
@@ -56,8 +115,8 @@ def _morphy(form, pos, check_exceptions=True):
         result = []
         seen = set()
         for form in forms:
-            if form in _lemma_pos_offset_map:
-                if pos in _lemma_pos_offset_map[form]:
+            if form in lemma_pos_offset_map:
+                if pos in lemma_pos_offset_map[form]:
                     if form not in seen:
                         result.append(form)
                         seen.add(form)
@@ -85,3 +144,43 @@ def _morphy(form, pos, check_exceptions=True):
 
     # Return an empty list if we can't find anything
     return []
+
+
+class MorphyCache:
+    """
+    A bounded LRU cache of `morphy()` results keyed by `(form, pos,
+    check_exceptions)`, the least recently used entry is evicted once it
+    holds `maxsize` entries. A `maxsize` of 0 disables the cache.
+    """
+    def __init__(self, maxsize=16384):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def morphy(self, form, pos=None, check_exceptions=True, store=None):
+        if not self.maxsize:
+            return morphy(form, pos, check_exceptions, store)
+        key = form, pos, check_exceptions
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+        base_form = morphy(form, pos, check_exceptions, store)
+        with self._lock:
+            self._cache[key] = base_form
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return base_form
+
+    def info(self):
+        return MorphyCacheInfo(self.hits, self.misses, self.evictions,
+                               self.maxsize, len(self._cache))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.evictions = 0
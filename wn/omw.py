@@ -10,6 +10,7 @@ import os
 from collections import defaultdict
 
 from wn.constants import omw_dir
+from wn.utils import WordNetError
 
 def parse_omw_line(omw_line):
     offset_pos, lemma_type, lemma  = omw_line.strip().split('\t')
@@ -72,12 +73,10 @@ class OpenMultilingualWordNet:
     def _load_lang_data(self, lang):
         ''' load the wordnet data of the requested language from the file to
         the cache, _lang_data '''
-        if lang in _lang_to_lemmas_to_offsets.keys():
-            if lang in _lang_to_offsets_to_lemma.keys(): # Paranoid check.
+        if lang in self._store.lang_to_lemmas_to_offsets.keys():
+            if lang in self._store.lang_to_offsets_to_lemma.keys(): # Paranoid check.
                 return
         if lang not in self.langs():
             raise WordNetError("Language is not supported.")
         # If not in cache, load the OMW.
-        offsets_to_lemmas, lemmas_to_offsets = self.custom_lemmas(lang)
-        _lang_to_offsets_to_lemma[lang] = offsets_to_lemmas
-        _lang_to_lemmas_to_offsets[lang] = lemmas_to_offsets
+        self._store.load_lang(lang)
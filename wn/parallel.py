@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Parallel parsing of the ``index.*`` and ``data.*`` files.
+
+The files are cut into byte ranges that end on line boundaries and each
+range is parsed in a worker process. Workers send back plain tuples (the
+snapshot records for synsets) which the parent turns into the same
+objects, in the same order, as the serial loader.
+
+Synset names are looked up in the lemma index, so the index files are
+parsed first and the data file workers start with a store holding the merged
+index: forked workers inherit it, others receive it through the pool
+initializer. Both need Python 3.7, see `PARALLEL_LOAD_SUPPORTED`.
+"""
+
+import io
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from wn.constants import _FILEMAP
+from wn.reader import parse_data_buffer, parse_index_line
+from wn.snapshot import record_to_synset, synset_to_record
+from wn.store import WordNetStore
+from wn.utils import WordNetError
+
+# `ProcessPoolExecutor` only takes a start method and a worker initializer
+# from Python 3.7 on, `WordNet` parses the files serially before that.
+PARALLEL_LOAD_SUPPORTED = sys.version_info >= (3, 7)
+
+# Size of the byte ranges handed to the workers, data.noun is ~15MB.
+_CHUNK_SIZE = 1 << 21
+
+
+def file_chunks(filename, chunk_size=_CHUNK_SIZE):
+    """ Splits `filename` into (start, end) byte ranges on line boundaries. """
+    size = os.path.getsize(filename)
+    chunks = []
+    with io.open(filename, 'rb') as fin:
+        start = 0
+        while start < size:
+            fin.seek(min(start + chunk_size, size))
+            fin.readline()
+            end = min(fin.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _read_lines(filename, start, end):
+    with io.open(filename, 'rb') as fin:
+        fin.seek(start)
+        lines = fin.read(end - start).decode('utf8').split('\n')
+    # The chunks end with a newline, drop the empty string after it.
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+# The store the data file workers parse the synsets for.
+_worker_store = None
+
+def _init_worker_store(wordnet_data_dir, lexname_type, lemma_pos_offset_map, lexnames):
+    global _worker_store
+    _worker_store = WordNetStore(wordnet_data_dir, lexname_type)
+    _worker_store.lemma_pos_offset_map = lemma_pos_offset_map
+    _worker_store._lexnames = lexnames
+
+
+def _parse_index_chunk(filename, start, end):
+    """ Returns the (lemma, pos, synset_offsets) of the index lines in range. """
+    entries = []
+    for line in _read_lines(filename, start, end):
+        if line.startswith(' '):
+            continue
+        try:
+            entries.append(parse_index_line(line))
+        except: # When there's inconsistencies.
+            raise WordNetError('Error parsing:\n{}\nfrom {}'.format(line, filename))
+    return entries
+
+
+def _parse_data_chunk(filename, start, end, lazy_gloss=False):
+    """
+    Returns the synset records of the data lines in range, with the glosses
+    unsplit if `lazy_gloss`.
+    """
+    with io.open(filename, 'rb') as fin:
+        fin.seek(start)
+        buffer = fin.read(end - start).decode('utf8')
+    return [synset_to_record(synset, keep_gloss=lazy_gloss) for synset in
+            parse_data_buffer(buffer, _worker_store.lexname_type, _worker_store,
+                              source=os.path.basename(filename), lazy_gloss=lazy_gloss)]
+
+
+def _submit_chunks(executor, prefix, wordnet_data_dir, parse_chunk, *args):
+    futures = []
+    for pos_tag in _FILEMAP.values():
+        filename = os.path.join(wordnet_data_dir, '{}.{}'.format(prefix, pos_tag))
+        for start, end in file_chunks(filename):
+            futures.append(executor.submit(parse_chunk, filename, start, end, *args))
+    return futures
+
+
+def parallel_load(store, processes, lazy_gloss=False):
+    """
+    Fills the lemma index and the synsets of `store` like
+    `WordNet._load_lemma_pos_offset_map()` and `WordNet._load_all_synsets()`
+    do, with the files parsed by `processes` worker processes. Raises
+    WordNetError before Python 3.7, see `PARALLEL_LOAD_SUPPORTED`.
+    """
+    global _worker_store
+    if not PARALLEL_LOAD_SUPPORTED:
+        raise WordNetError('Parallel loading needs Python 3.7 or later.')
+    wordnet_data_dir = store.wordnet_data_dir
+    lemma_pos_offset_map = store.lemma_pos_offset_map
+    synset_offset_cache = store.synset_offset_cache
+    forking = 'fork' in multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if forking else None)
+
+    # Results are merged in submission order, i.e. file order, so the dicts
+    # end up in the same order as when the files are read serially.
+    with store.load_report.phase('index.* ({} processes)'.format(processes)) as phase, \
+         ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = _submit_chunks(executor, 'index', wordnet_data_dir, _parse_index_chunk)
+        for future in futures:
+            entries = future.result()
+            phase.lines += len(entries)
+            for lemma, pos, synset_offsets in entries:
+                lemma_pos_offset_map[lemma][pos] = synset_offsets
+                if pos == 'a':
+                    lemma_pos_offset_map[lemma]['s'] = synset_offsets
+
+    # The workers of this pool are only started once the index is complete.
+    lexnames = None if store.lexname_type == 'clusters' else store.lexnames
+    worker_store_args = (wordnet_data_dir, store.lexname_type, lemma_pos_offset_map, lexnames)
+    if forking:
+        _init_worker_store(*worker_store_args)
+        initializer, initargs = None, ()
+    else:
+        initializer, initargs = _init_worker_store, worker_store_args
+    try:
+        with store.load_report.phase('data.* ({} processes)'.format(processes)) as phase, \
+             ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                                 initializer=initializer, initargs=initargs) as executor:
+            futures = _submit_chunks(executor, 'data', wordnet_data_dir, _parse_data_chunk,
+                                     lazy_gloss)
+            for future in futures:
+                records = future.result()
+                phase.lines += len(records)
+                for record in records:
+                    synset = record_to_synset(record, store)
+                    synset_offset_cache[synset._pos][synset._offset] = synset
+    finally:
+        _worker_store = None
@@ -137,6 +137,10 @@ class WordNetPaths:
         """
         if synset1 == synset2:
             return 0
+        relation_graph = getattr(synset1, '_store', None) and synset1._store.relation_graph
+        if (relation_graph is not None and
+            synset1 in relation_graph and synset2 in relation_graph):
+            return relation_graph.shortest_path_distance(synset1, synset2, simulate_root)
         # Find the shortest hypernym path to *ROOT*
         dist_dict1 = find_shortest_hypernym_paths_to_root(synset1, simulate_root)
         dist_dict2 = find_shortest_hypernym_paths_to_root(synset2, simulate_root)
@@ -190,7 +194,7 @@ class WordNetPaths:
         for ii in self.all_synsets(pos):
             try:
                 depth = max(depth, ii.max_depth())
-            except RuntimeError:
+            except WordNetError:
                 print(ii)
         if simulate_root:
             depth += 1
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Prefix search over lemma names, e.g. for autocompletion.
+
+A `PrefixIndex` keeps the lemma names of a language sorted, in total and
+per part of speech, so the names that start with a prefix are the run that
+`bisect` finds for it.
+"""
+
+import sys
+from bisect import bisect_left
+
+
+class PrefixIndex:
+    def __init__(self, pos_to_names):
+        """
+        :param pos_to_names: A pos -> lemma names mapping, the names are
+        lowercased like the keys of the lemma indexes.
+        """
+        self._sorted_names = {pos: sorted(names) for pos, names in pos_to_names.items()}
+        self._sorted_names[None] = sorted(set().union(*pos_to_names.values()))
+
+    def search(self, prefix, pos=None, limit=None):
+        """
+        The names that start with `prefix` in alphabetical order, only those
+        of part of speech `pos` if given and at most `limit` of them.
+        """
+        names = self._sorted_names.get(pos, [])
+        start = bisect_left(names, prefix)
+        # The names with the prefix sort before the prefix with its last
+        # character incremented.
+        upper = prefix.rstrip(chr(sys.maxunicode))
+        if upper:
+            end = bisect_left(names, upper[:-1] + chr(ord(upper[-1]) + 1), start)
+        else:
+            end = len(names)
+        if limit is not None:
+            end = min(end, start + limit)
+        return names[start:end]
+
+    def __len__(self):
+        return len(self._sorted_names[None])
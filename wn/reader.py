@@ -7,97 +7,239 @@
 
 import re
 import warnings
-from collections import defaultdict
 
-from wn.constants import lexnames
 from wn.constants import _synset_types
 from wn.lemma import Lemma
-from wn.synset import Synset
+from wn.store import default_store
+from wn.synset import LazyGlossSynset, Synset, pack_pointers
 from wn.utils import WordNetError
-from wn.utils import per_chunk
+from wn.utils import per_chunk, split_gloss
 
-def parse_wordnet_line(wordnet_line, parse_verb_frame=False, lexname_type=None):
-    # Split the network information from the gloss.
-    columns_str, gloss = wordnet_line.strip().split('|')
-    # Extract the definition and examples from the gloss.
+def parse_gloss(gloss):
+    """ Splits a gloss into the definition and the quoted examples. """
     definition = re.sub(r"[\"].*?[\"]", "", gloss).strip(';, ')
     examples = re.findall(r'"([^"]*)"', gloss)
+    return definition, examples
 
-    # The first 4 columns.
-    offset, lexname_index, pos, n_lemmas, *the_rest = columns_str.split()
-    offset = int(offset)
-    lexname_index = int(lexname_index)
-    n_lemmas = int(n_lemmas, 16)
 
-    # The next `n_lemmas` * 2 terms are lemmas.
-    lemma_tokens = the_rest[:n_lemmas*2]
+def split_syntactic_marker(lemma_name):
+    """ Same as a `(.*?)(\\(.*\\))?$` match, the name and its marker (or None). """
+    if lemma_name.endswith(')') and '(' in lemma_name:
+        marker_start = lemma_name.index('(')
+        return lemma_name[:marker_start], lemma_name[marker_start:]
+    return lemma_name, None
+
+
+def parse_lemma_tokens(lemma_tokens, lexname_index, lemma_pos_offset_map):
+    """
+    Parses the `lemma lex_id` pairs of a data file line into the
+    (name, lexname_index, lex_id, syntactic_marker) of the lemmas.
+    """
     lemmas = []
-    for lemma_name, lex_id in per_chunk(lemma_tokens, 2):
-        lex_id = int(lex_id, 16)
-        # If lemma matches any in the `_lemma_pos_offset_map`
-        if lemma_name.lower() in _lemma_pos_offset_map:
-            lemmas.append((lemma_name, lexname_index, lex_id, None))
+    for i in range(0, len(lemma_tokens), 2):
+        lemma_name = lemma_tokens[i]
+        # If lemma matches any in the `lemma_pos_offset_map`
+        if lemma_name.lower() in lemma_pos_offset_map:
+            syn_mark = None
         else: # Else, if the lemma has a syntactic marker, extract it.
-            m = re.match(r'(.*?)(\(.*\))?$', lemma_name)
-            lemma_name, syn_mark = m.groups()
-            lemmas.append((lemma_name, lexname_index, lex_id, syn_mark))
+            lemma_name, syn_mark = split_syntactic_marker(lemma_name)
+        lemmas.append((lemma_name, lexname_index, int(lemma_tokens[i+1], 16), syn_mark))
+    return lemmas
+
+
+def parse_pointer_tokens(pointers_tokens, lemma_names):
+    """
+    Parses the `symbol offset pos source/target` quadruples of a data file
+    line into the `symbol -> set((pos, offset))` synset pointers and the
+    `lemma_name -> symbol -> [(pos, offset, lemma_index)]` lemma pointers.
+    """
+    synset_pointers = {}
+    lemma_pointers = {}
+    for i in range(0, len(pointers_tokens), 4):
+        symbol, pointer_offset, pointer_pos, lemma_ids_str = pointers_tokens[i:i+4]
+        if lemma_ids_str == '0000':
+            if symbol not in synset_pointers:
+                synset_pointers[symbol] = set()
+            synset_pointers[symbol].add((pointer_pos, int(pointer_offset)))
+        else:
+            source_name = lemma_names[int(lemma_ids_str[:2], 16) - 1]
+            target = (pointer_pos, int(pointer_offset), int(lemma_ids_str[2:], 16) - 1)
+            by_symbol = lemma_pointers.setdefault(source_name, {})
+            if symbol not in by_symbol:
+                by_symbol[symbol] = []
+            by_symbol[symbol].append(target)
+    return synset_pointers, lemma_pointers
 
-    # Find the synset and lemma connections.
-    synset_pointers = defaultdict(set)
-    lemma_pointers = defaultdict(list)
 
+def pointer_tokens_span(the_rest, n_lemmas):
+    """
+    Returns the start and end index of the pointer quadruples in the tokens
+    that follow the first 4 columns of a data file line.
+    """
     # The next `n_pointers` * 4 terms are edges connecting to the synset.
     n_pointers = int(the_rest[n_lemmas*2])
     pointers_start = n_lemmas*2+1
     pointers_end = pointers_start + n_pointers * 4
-    pointers_tokens = the_rest[pointers_start:pointers_end]
-    for symbol, pointer_offset, pointer_pos, lemma_ids_str in per_chunk(pointers_tokens, 4):
-        if symbol.isdigit():
-            print(symbol, pointer_offset, pointer_pos, lemma_ids_str)
-        if lemma_ids_str == '0000':
-            synset_pointers[symbol].add((pointer_pos, int(pointer_offset)))
+    return pointers_start, pointers_end
+
+
+def parse_verb_frame_tokens(frame_tokens, n_lemmas):
+    """
+    Parses the `+ frame_number lemma_number` triples of a verb line into the
+    frame numbers (as bytes) of the synset and of each of its lemmas. Like
+    NLTK, frames with lemma number 0 belong to the synset and to all its
+    lemmas, the others only to that lemma.
+    """
+    synset_frames = bytearray()
+    lemma_frames = [bytearray() for _ in range(n_lemmas)]
+    for plus, frame_number, lemma_number in per_chunk(frame_tokens, 3):
+        frame_number = int(frame_number)
+        lemma_number = int(lemma_number, 16)
+        if lemma_number == 0:
+            synset_frames.append(frame_number)
+            for frames in lemma_frames:
+                frames.append(frame_number)
         else:
-            source_index = int(lemma_ids_str[:2], 16) - 1
-            target_index = int(lemma_ids_str[2:], 16) - 1
-            source_lemma_name = lemmas[source_index][0]
-            lemma_pointers[source_lemma_name, symbol].append((pointer_pos, int(pointer_offset), int(target_index)))
-            #print(offset, lemma_pointers)
-
-    # The next rest of the terms (i.e. `frame_count` * 3)
-    # are verb frame information.
-    if parse_verb_frame and the_rest[pointers_end:]:
-        frame_count = the_rest[pointers_end]
-        for plus, frame_number, lemma_number in per_chunk(the_rest[pointers_end+1:], 3):
-            # TODO: need to write for verb frame.
-            ##print(plus, frame_number, lemma_number)
-            pass
+            lemma_frames[lemma_number - 1].append(frame_number)
+    return bytes(synset_frames), [bytes(frames) for frames in lemma_frames]
+
+
+def parse_synset_columns(the_rest, lemma_names, parse_verb_frame=True):
+    """
+    Parses the pointers and verb frames that follow the lemmas in the
+    tokens after the first 4 columns of a data file line, returns the
+    synset and lemma pointers (see `parse_pointer_tokens()`) and the synset
+    and lemma frames (see `parse_verb_frame_tokens()`).
+    """
+    n_lemmas = len(lemma_names)
+    pointers_start, pointers_end = pointer_tokens_span(the_rest, n_lemmas)
+    synset_pointers, lemma_pointers = parse_pointer_tokens(
+        the_rest[pointers_start:pointers_end], lemma_names)
+    # The rest of the terms (i.e. `frame_count` * 3) are verb frames.
+    if parse_verb_frame and pointers_end < len(the_rest):
+        frame_count = int(the_rest[pointers_end])
+        frame_tokens = the_rest[pointers_end+1:pointers_end+1+frame_count*3]
+        synset_frames, lemma_frames = parse_verb_frame_tokens(frame_tokens, n_lemmas)
+    else:
+        synset_frames, lemma_frames = b'', [b''] * n_lemmas
+    return synset_pointers, lemma_pointers, synset_frames, lemma_frames
 
 
+def make_synset_name(first_lemma_name, pos, offset, lemma_pos_offset_map,
+                     sense_numbers=None):
+    """
+    The `lemma.pos.nn` name of a synset, from its first lemma. The
+    `(lemma, pos) -> offset -> sense number` maps are kept in
+    `sense_numbers`, if given, for the next synsets of the same lemma.
+    """
     # Copying behavior from NLTK
     # See https://github.com/nltk/nltk/blob/develop/nltk/corpus/reader/wordnet.py#L1512
-    first_lemma_name = lemmas[0][0].lower()
-    offsets = _lemma_pos_offset_map[first_lemma_name][pos]
-    #print(offset, synset_name, pos, offsets)
-    sense_index = offsets.index(offset)
-    synset_name = "%s.%s.%02i" % (first_lemma_name, pos, sense_index+1)
+    first_lemma_name = first_lemma_name.lower()
+    key = first_lemma_name, pos
+    numbers = None if sense_numbers is None else sense_numbers.get(key)
+    if numbers is None:
+        numbers = {}
+        # Keep the first position, like `list.index()`.
+        for number, lemma_offset in enumerate(lemma_pos_offset_map[first_lemma_name][pos], 1):
+            numbers.setdefault(lemma_offset, number)
+        if sense_numbers is not None:
+            sense_numbers[key] = numbers
+    return "%s.%s.%02i" % (first_lemma_name, pos, numbers[offset])
+
+
+def make_lexname(lexname_index, lexname_type, store):
+    if lexname_type == 'clusters':
+        return str(lexname_index)
+    return store.lexnames[lexname_index]
+
+
+def parse_data_line(line, lexname_type, store, parse_verb_frame=True,
+                    lazy_gloss=False, sense_numbers=None):
+    """
+    Parses a (stripped) line of a ``data.*`` file into a Synset and its
+    Lemmas (the Synset's `_lemmas`), for `store`. With `lazy_gloss`, the
+    gloss is only split when used (see `LazyGlossSynset`). `sense_numbers`
+    is passed on to `make_synset_name()`.
+    """
+    lemma_pos_offset_map = store.lemma_pos_offset_map
+    # Split the network information from the gloss.
+    columns_str, gloss = line.split('|')
+
+    # The first 4 columns.
+    offset, lexname_index, pos, n_lemmas, *the_rest = columns_str.split()
+    offset = int(offset)
+    lexname_index = int(lexname_index)
+    n_lemmas = int(n_lemmas, 16)
+
+    # The next `n_lemmas` * 2 terms are lemmas.
+    lemmas = parse_lemma_tokens(the_rest[:n_lemmas*2], lexname_index, lemma_pos_offset_map)
+    synset_pointers, lemma_pointers, synset_frames, lemma_frames = parse_synset_columns(
+        the_rest, [lemma[0] for lemma in lemmas], parse_verb_frame)
 
     # First lemma name is the synset name.
-    lemmas_objects = []
+    synset_name = make_synset_name(lemmas[0][0], pos, offset, lemma_pos_offset_map,
+                                   sense_numbers)
+
     # Creating the Lemma objects.
-    for lemma in lemmas:
-        ##lemma_name, lexname_index, lex_id, syn_mark = lemma
-        lemmas_objects.append(Lemma(*lemma,
-                                    synset_offset=offset,
-                                    synset_pos=pos,
-                                    synset_name=synset_name,
-                                    lemma_pointers=lemma_pointers))
+    lemma_objects = []
+    for lemma, frame_ids in zip(lemmas, lemma_frames):
+        lemma_objects.append(Lemma(*lemma,
+                                   synset_offset=offset,
+                                   synset_pos=pos,
+                                   synset_name=synset_name,
+                                   lemma_pointers=pack_pointers(lemma_pointers.get(lemma[0])),
+                                   frame_ids=frame_ids))
     # Create the Synset object
-    _lexname = str(lexname_index) if lexname_type == 'clusters' else lexnames[lexname_index]
-    synset = Synset(offset, pos, synset_name, lexname_index, _lexname,
-                    definition, examples, synset_pointers, lemmas_objects, wordnet_line)
+    _lexname = make_lexname(lexname_index, lexname_type, store)
+    if lazy_gloss:
+        return LazyGlossSynset(offset, pos, synset_name, lexname_index, _lexname,
+                               gloss, synset_pointers, lemma_objects, store,
+                               synset_frames)
+    # Extract the definition and examples from the gloss.
+    definition, examples = split_gloss(gloss)
+    return Synset(offset, pos, synset_name, lexname_index, _lexname,
+                  definition, examples, synset_pointers, lemma_objects, store,
+                  synset_frames)
+
 
-    # Return the important stuff.
-    return synset, lemmas_objects
+def parse_wordnet_line(wordnet_line, parse_verb_frame=True, lexname_type=None,
+                       store=None, lazy_gloss=False):
+    """
+    Parses a line of a ``data.*`` file into a Synset and its Lemmas, for
+    `store` (`default_store()` by default), see `parse_data_line()`.
+    """
+    store = store or default_store()
+    synset = parse_data_line(wordnet_line.strip(), lexname_type, store,
+                             parse_verb_frame, lazy_gloss)
+    return synset, synset._lemmas
+
+
+def parse_data_buffer(buffer, lexname_type=None, store=None, source='data file',
+                      lazy_gloss=False):
+    """
+    Bulk version of `parse_wordnet_line()`: parses the lines of a whole
+    ``data.*`` file (`buffer` holds its decoded content) in one pass and
+    yields the same Synsets, with the same Lemmas, in file order. The
+    offset -> sense number mapping of each (lemma, pos) is built once.
+    `source` names the file in the parsing errors, `lazy_gloss` is the same
+    as for `parse_wordnet_line()`.
+    """
+    store = store or default_store()
+    # Map from (lemma, pos) -> offset -> sense number
+    sense_numbers = {}
+
+    # Not `splitlines()`, which also splits on the form feeds, line and
+    # paragraph separators etc. that a gloss may contain.
+    for line in buffer.split('\n'):
+        # Skip documentation and empty lines (e.g. after the last newline).
+        if line.startswith(' ') or not line.strip():
+            continue
+        try:
+            synset = parse_data_line(line.strip(), lexname_type, store,
+                                     lazy_gloss=lazy_gloss, sense_numbers=sense_numbers)
+        except Exception:
+            raise WordNetError("Error parsing this line from {}:\n{}".format(source, line))
+        yield synset
 
 
 def fix_inconsistent_line(index_line):
@@ -132,6 +274,9 @@ def parse_index_line(index_line):
     return lemma, pos, synset_offsets
 
 
+SENSE_KEY_RE = re.compile(r"(.*)\%(.*):(.*):(.*):(.*):(.*)")
+
+
 def parse_sense_key(sense_key):
     """
     Retrieves synset based on a given sense_key. Sense keys can be
@@ -157,8 +302,10 @@ def parse_sense_key(sense_key):
     head_id:     uniquely identifies sense in a lexicographer file when paired with head_word
                  Only used if head_word is present (2 digit int)
     """
-    sense_key_regex = re.compile(r"(.*)\%(.*):(.*):(.*):(.*):(.*)")
-    lemma, ss_type, _, lex_id, _, _ = sense_key_regex.match(sense_key).groups()
+    match = SENSE_KEY_RE.match(sense_key)
+    if match is None:
+        raise WordNetError("{!r} is not a sense key".format(sense_key))
+    lemma, ss_type, _, lex_id, _, _ = match.groups()
     # check that information extracted from sense_key is valid
     error = None
     if not lemma:
@@ -175,17 +322,18 @@ def parse_sense_key(sense_key):
     return lemma, pos, lex_id
 
 
-def parse_lemma_pos_index(lemma_pos_index):
+def parse_lemma_pos_index(lemma_pos_index, store=None):
     lemma, pos, synset_index_str = lemma_pos_index.lower().rsplit('.', 2)
     synset_index = int(synset_index_str) - 1
+    store = store or default_store()
     # Get the offset for this synset
     try:
-        offset = _lemma_pos_offset_map[lemma][pos][synset_index]
+        offset = store.lemma_pos_offset_map.get(lemma, {})[pos][synset_index]
     except KeyError:
         message = 'no lemma %r with part of speech %r'
         raise WordNetError(message % (lemma, pos))
     except IndexError:
-        n_senses = len(_lemma_pos_offset_map[lemma][pos])
+        n_senses = len(store.lemma_pos_offset_map[lemma][pos])
         message = "lemma %r with part of speech %r has only %i %s"
         message = message % lemma, pos, n_senses, "sense"
         raise WordNetError(message if n_senses > 1 else message+'s')
@@ -194,7 +342,7 @@ def parse_lemma_pos_index(lemma_pos_index):
     # users really doesn't care, so we resolve it and raise warning.
     if pos in ['a', 's']:
         # Raise error if user wants an `s` but offset is in `a`,
-        if pos == 's' and offset in _synset_offset_cache['a']:
+        if pos == 's' and offset in store.synset_offset_cache['a']:
             message = (
                 'adjective satellite requested but '
                 'only plain adjective found for lemma %r'
@@ -202,7 +350,7 @@ def parse_lemma_pos_index(lemma_pos_index):
             raise WordNetError(message % lemma)
         # Push warning and change the POS
         # if user wants an `a` but offset is in `s`,
-        elif pos == 'a' and offset in _synset_offset_cache['s']:
+        elif pos == 'a' and offset in store.synset_offset_cache['s']:
             message = (
                 'plain adjective requested but '
                 'only adjective satellite found for lemma %r'
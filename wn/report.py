@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Timing and memory instrumentation of the load phases.
+
+Each phase (an index or data file, ``cntlist.rev``, the exception lists,
+an OMW language, an IC file, ...) is recorded in a `LoadReport` with its
+wall time, the number of lines parsed and the change of the resident set
+size, and logged to the ``wn`` logger at INFO level.
+"""
+
+import logging
+import os
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+logger = logging.getLogger('wn')
+
+#: `memory_delta` is in bytes, None where the resident set size is unknown.
+LoadPhase = namedtuple('LoadPhase', ['name', 'seconds', 'lines', 'memory_delta'])
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def current_rss():
+    """ The resident set size in bytes, or None without /proc/self/statm """
+    try:
+        with open('/proc/self/statm') as fin:
+            return int(fin.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _PhaseCounter:
+    """ Filled in by the code of a phase. """
+    def __init__(self):
+        self.lines = 0
+
+
+class LoadReport:
+    def __init__(self):
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Records the phase `name` for the duration of the `with` block, the
+        block sets the number of lines it parsed on the yielded counter.
+        """
+        counter = _PhaseCounter()
+        rss_before = current_rss()
+        start = time.perf_counter()
+        yield counter
+        seconds = time.perf_counter() - start
+        rss_after = current_rss()
+        memory_delta = None if None in (rss_before, rss_after) else rss_after - rss_before
+        loaded = LoadPhase(name, seconds, counter.lines, memory_delta)
+        self.phases.append(loaded)
+        logger.info('Loaded %s in %.3fs: %d lines, %s', name, seconds, counter.lines,
+                    'memory unknown' if memory_delta is None else
+                    '%+.1f MB' % (memory_delta / 2**20))
+
+    def __iter__(self):
+        return iter(self.phases)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def total_seconds(self):
+        return sum(loaded.seconds for loaded in self.phases)
+
+    def __str__(self):
+        rows = ['{:<32} {:>9} {:>9} {:>10}'.format('phase', 'seconds', 'lines', 'MB')]
+        for loaded in self.phases:
+            memory = '' if loaded.memory_delta is None else '%+.1f' % (loaded.memory_delta / 2**20)
+            rows.append('{:<32} {:>9.3f} {:>9} {:>10}'.format(
+                loaded.name, loaded.seconds, loaded.lines, memory))
+        return '\n'.join(rows)
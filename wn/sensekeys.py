@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+The sense keys of all lemmas, computed in one pass.
+
+A lemma is identified by the part of speech and offset of its synset and
+its position in the synset, packed into one integer by `lemma_id()`.
+`SenseKeyTable` keeps the ids sorted in an array with the keys in a list
+alongside, so the key of an id is found with `bisect`, and maps the keys
+back to the ids.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from wn.constants import _pos_numbers, _synset_types
+
+
+def lemma_id(pos, offset, lemma_index):
+    """ Packs the position of a lemma into one integer. """
+    return _pos_numbers[pos] << 40 | offset << 8 | lemma_index
+
+
+def split_lemma_id(packed_id):
+    """ The (pos, offset, lemma_index) of a `lemma_id()`. """
+    return _synset_types[packed_id >> 40], (packed_id >> 8) & 0xffffffff, packed_id & 0xff
+
+
+class SenseKeyTable:
+    def __init__(self, lemma_keys):
+        """
+        :param lemma_keys: The (lemma_id, sense_key) of the lemmas.
+        """
+        lemma_keys = sorted(lemma_keys)
+        self._lemma_ids = array('Q', [packed_id for packed_id, _ in lemma_keys])
+        self._keys = [sense_key for _, sense_key in lemma_keys]
+        # A few lemmas of a synset only differ in case and share their key,
+        # it is mapped to the first of them.
+        self._key_to_id = {sense_key: packed_id for packed_id, sense_key in reversed(lemma_keys)}
+
+    def key(self, packed_id):
+        """ The sense key of the lemma `packed_id`, or None. """
+        i = bisect_left(self._lemma_ids, packed_id)
+        if i < len(self._lemma_ids) and self._lemma_ids[i] == packed_id:
+            return self._keys[i]
+        return None
+
+    def lemma_id(self, sense_key):
+        """ The `lemma_id()` of the (lowercased) `sense_key`, or None. """
+        return self._key_to_id.get(sense_key)
+
+    def items(self):
+        """ The (sense_key, lemma_id) pairs in the order of the ids. """
+        return zip(self._keys, self._lemma_ids)
+
+    def __len__(self):
+        return len(self._keys)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Prebuilt binary snapshots of a parsed WordNet.
+
+A snapshot holds the lemma index, every synset (with its lemmas and
+pointers), the lemma counts and, if they were built, the inflection index
+of `wn.morphy` and the gloss index of `wn.gloss` as plain tuples, bytes and
+dicts serialized with `marshal`, so loading one never re-tokenizes the
+``index.*`` or ``data.*`` files.
+Each snapshot records the format version it was written with and the
+sizes, modification times and checksum of the source files it was built
+from; a snapshot that doesn't match the current data directory is
+rejected. The files are only hashed if their sizes or modification times
+changed, so loading an up-to-date snapshot doesn't read them.
+"""
+
+import gc
+import hashlib
+import io
+import marshal
+import os
+import struct
+
+from wn.constants import _FILEMAP
+from wn.lemma import Lemma
+from wn.synset import LazyGlossSynset, Synset
+from wn.utils import WordNetError
+
+# Bump this whenever the layout of the records below changes.
+SNAPSHOT_FORMAT = 4
+
+_SNAPSHOT_MAGIC = b'WNSNAP\x00'
+# The header is prefixed with its length so the tables can be read in one go.
+_HEADER_LENGTH = struct.Struct('<I')
+
+# The files in a WordNet data directory that a snapshot is built from.
+_SNAPSHOT_SOURCES = tuple(['lexnames', 'cntlist.rev'] +
+                          ['index.{}'.format(suffix) for suffix in sorted(_FILEMAP.values())] +
+                          ['data.{}'.format(suffix) for suffix in sorted(_FILEMAP.values())] +
+                          # For the inflection index.
+                          ['{}.exc'.format(suffix) for suffix in sorted(_FILEMAP.values())])
+
+
+def source_checksum(wordnet_data_dir):
+    """ SHA-1 over the names and contents of the snapshot's source files. """
+    checksum = hashlib.sha1()
+    for filename in _SNAPSHOT_SOURCES:
+        checksum.update(filename.encode('utf8'))
+        with open(os.path.join(wordnet_data_dir, filename), 'rb') as fin:
+            for block in iter(lambda: fin.read(1 << 20), b''):
+                checksum.update(block)
+    return checksum.hexdigest()
+
+
+def source_stats(wordnet_data_dir):
+    """ The (name, size, mtime_ns) of the snapshot's source files. """
+    stats = []
+    for filename in _SNAPSHOT_SOURCES:
+        stat = os.stat(os.path.join(wordnet_data_dir, filename))
+        stats.append((filename, stat.st_size, stat.st_mtime_ns))
+    return tuple(stats)
+
+
+def synset_to_record(synset, keep_gloss=False):
+    """
+    Flattens a Synset and its Lemmas into a marshal-able tuple. With
+    `keep_gloss` the raw gloss of a LazyGlossSynset that wasn't split yet
+    is kept, as the definition with None for the examples.
+    """
+    lemmas = tuple((lemma._name, lemma._lexname_index, lemma._lex_id,
+                    lemma._syntactic_marker, lemma._packed_pointers, lemma._frame_ids)
+                   for lemma in synset._lemmas)
+    if keep_gloss and isinstance(synset, LazyGlossSynset) and isinstance(synset._gloss, str):
+        definition, examples = synset._gloss, None
+    else:
+        definition, examples = synset._definition, tuple(synset._examples)
+    return (synset._offset, synset._pos, synset._name, synset._lexname,
+            definition, examples, synset._packed_pointers, lemmas, synset._frame_ids)
+
+
+def record_to_synset(record, store=None):
+    """ Rebuilds the Synset (and its Lemmas) from `synset_to_record()`. """
+    (offset, pos, name, lexname, definition, examples, pointers, lemmas, frame_ids) = record
+    lemma_objects = [Lemma(lemma_name, lexname_index, lex_id, syntactic_marker,
+                           synset_offset=offset, synset_pos=pos,
+                           synset_name=name, lemma_pointers=lemma_pointers,
+                           frame_ids=lemma_frame_ids)
+                     for (lemma_name, lexname_index, lex_id, syntactic_marker, lemma_pointers,
+                          lemma_frame_ids) in lemmas]
+    lexname_index = lemmas[0][1] if lemmas else None
+    if examples is None: # The raw gloss, see `synset_to_record()`.
+        return LazyGlossSynset(offset, pos, name, lexname_index, lexname,
+                               definition, pointers, lemma_objects, store, frame_ids)
+    return Synset(offset, pos, name, lexname_index, lexname,
+                  definition, list(examples), pointers, lemma_objects, store, frame_ids)
+
+
+def save_snapshot(filename, wordnet_data_dir, lexname_type, tables):
+    """
+    Writes `tables` (a dict of marshal-able objects) to `filename`, tagged
+    with the format version and the checksum of `wordnet_data_dir`.
+    The file is written to a temporary name first and then moved into place
+    so that concurrent readers never see a partial snapshot.
+    """
+    header = {'format': SNAPSHOT_FORMAT,
+              'checksum': source_checksum(wordnet_data_dir),
+              'sources': source_stats(wordnet_data_dir),
+              'lexname_type': lexname_type}
+    header = marshal.dumps(header)
+    tmp_filename = '{}.{}.tmp'.format(filename, os.getpid())
+    with io.open(tmp_filename, 'wb') as fout:
+        fout.write(_SNAPSHOT_MAGIC)
+        fout.write(_HEADER_LENGTH.pack(len(header)))
+        fout.write(header)
+        marshal.dump(tables, fout)
+    os.replace(tmp_filename, filename)
+
+
+def load_snapshot(filename, wordnet_data_dir, lexname_type, store=None, verify=False):
+    """
+    Reads the tables written by `save_snapshot()`, with the synset records
+    turned back into Synset objects of `store`. Raises WordNetError if the file is not
+    a snapshot, was written by another format version or doesn't match the
+    files in `wordnet_data_dir`. With `verify`, the checksum of the files is
+    compared even if their sizes and modification times are unchanged.
+    """
+    with io.open(filename, 'rb') as fin:
+        if fin.read(len(_SNAPSHOT_MAGIC)) != _SNAPSHOT_MAGIC:
+            raise WordNetError('{} is not a WordNet snapshot'.format(filename))
+        try:
+            header_length, = _HEADER_LENGTH.unpack(fin.read(_HEADER_LENGTH.size))
+            header = marshal.loads(fin.read(header_length))
+        except (struct.error, EOFError, ValueError, TypeError):
+            raise WordNetError('{} is not a WordNet snapshot'.format(filename))
+        if not isinstance(header, dict):
+            raise WordNetError('{} is not a WordNet snapshot'.format(filename))
+        if header.get('format') != SNAPSHOT_FORMAT:
+            raise WordNetError('Snapshot format {} is not supported, '
+                               'expected {}'.format(header.get('format'), SNAPSHOT_FORMAT))
+        if header.get('lexname_type') != lexname_type:
+            raise WordNetError('Snapshot was built with lexname_type={!r}'.format(header.get('lexname_type')))
+        if verify or header.get('sources') != source_stats(wordnet_data_dir):
+            # The files may only have been touched or copied.
+            if header.get('checksum') != source_checksum(wordnet_data_dir):
+                raise WordNetError('Snapshot is stale for {}'.format(wordnet_data_dir))
+        # Nothing created here is garbage, so don't let the cyclic garbage
+        # collector repeatedly scan the objects while they are being unpacked.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # `marshal.loads()` on the whole buffer is much faster than
+            # `marshal.load()` pulling from the file object piecemeal.
+            tables = marshal.loads(fin.read())
+            if not (isinstance(tables, dict) and
+                    all(isinstance(tables.get(name), dict)
+                        for name in ('lemma_pos_offset_map', 'lemmakey_to_count'))):
+                raise ValueError('missing tables')
+            tables['synsets'] = [record_to_synset(record, store) for record in tables['synsets']]
+            return tables
+        # A truncated body or records of the wrong shape.
+        except (EOFError, ValueError, TypeError, KeyError, IndexError):
+            raise WordNetError('{} is corrupt'.format(filename))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
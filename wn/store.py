@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+The parsed tables of a WordNet data directory.
+
+Every `WordNet` instance reads from one `WordNetStore` and every synset
+keeps a reference to the store it was loaded into. Stores are registered by
+data directory, lexname type and backend, so opening the same directory
+again reuses the loaded store instead of parsing it a second time, while
+different directories (e.g. WordNet 3.0 and 3.3) never share any tables.
+The registry only holds weak references: a store is freed with the last
+WordNet (or synset) using it.
+
+A store is shared, not copied: the tables that are built after loading
+(`WordNet.build_relation_graph()`, `build_inflection_index()`,
+`build_synset_index()` and `build_gloss_index()`) and the sense keys and
+counts that lemmas compute on first use are kept in the store, so every
+WordNet on the same directory, lexname type and backend sees them. They
+are derived from the files only and speed up the lookups without changing
+their results.
+"""
+
+import os
+import weakref
+from array import array
+from collections import defaultdict
+
+from wn.constants import ADJ, ADJ_SAT, POS_LIST, VERB, load_exception_map, load_lexnames
+from wn.constants import load_sense_index, wordnet_dir
+from wn.frequency import SenseFrequencies
+from wn.fuzzy import FuzzyIndex
+from wn.lemma import format_sense_key, satellite_head
+from wn.omw import OpenMultilingualWordNet
+from wn.prefix import PrefixIndex
+from wn.report import LoadReport
+from wn.sensekeys import SenseKeyTable, lemma_id, split_lemma_id
+
+# Map from (realpath, lexname_type, backend) -> WordNetStore, for the stores
+# still in use.
+_stores = weakref.WeakValueDictionary()
+
+# See `default_store()`, kept once loaded.
+_default_store = None
+
+
+class WordNetStore:
+    def __init__(self, wordnet_data_dir, lexname_type=None):
+        self.wordnet_data_dir = wordnet_data_dir
+        self.lexname_type = lexname_type
+
+        # Map from lemma -> pos -> synset_index -> offset
+        self.lemma_pos_offset_map = defaultdict(dict)
+        # Map from pos -> offset -> synset
+        self.synset_offset_cache = defaultdict(dict)
+
+        # The wordnet data of the other languages, loaded when first used.
+        self.lang_to_offsets_to_lemma = defaultdict(dict)
+        self.lang_to_lemmas_to_offsets = defaultdict(dict)
+
+        # Map from sensekey -> count
+        self.lemmakey_to_count = {}
+
+        # The array-backed relation graph, see `WordNet.build_relation_graph()`
+        self.relation_graph = None
+
+        # Map from form -> base forms per pos, see `WordNet.build_inflection_index()`
+        self.inflection_index = None
+
+        # Map from form -> synsets of all pos, see `WordNet.build_synset_index()`
+        self.synset_index = None
+
+        # The inverted index of the glosses, see `WordNet.build_gloss_index()`
+        self.gloss_index = None
+
+        # Read from `wordnet_data_dir` when first used.
+        self._lexnames = self._exception_map = None
+        # Map from sense key -> (pos, offset), see `sense_index`.
+        self._sense_index = None
+        # See `sense_key_table`.
+        self._sense_key_table = None
+        # See `sense_frequencies`.
+        self._sense_frequencies = None
+        # Map from verb frame -> lemmas, see `verb_frame_index`.
+        self._verb_frame_index = None
+        # Map from lang -> PrefixIndex, see `prefix_index()`.
+        self._prefix_indexes = {}
+        # See `fuzzy_index`.
+        self._fuzzy_index = None
+
+        # The load phases of this store, see `wn.report`.
+        self.load_report = LoadReport()
+
+    @property
+    def lexnames(self):
+        if self._lexnames is None:
+            with self.load_report.phase('lexnames') as phase:
+                self._lexnames = load_lexnames(self.wordnet_data_dir)
+                phase.lines = len(self._lexnames)
+        return self._lexnames
+
+    @property
+    def exception_map(self):
+        if self._exception_map is None:
+            with self.load_report.phase('exception map') as phase:
+                self._exception_map = load_exception_map(self.wordnet_data_dir)
+                phase.lines = sum(len(exceptions) for pos, exceptions
+                                  in self._exception_map.items() if pos != ADJ_SAT)
+        return self._exception_map
+
+    @property
+    def sense_index(self):
+        """
+        The sense key -> (pos, offset) map, read from ``index.sense`` or, if
+        the data directory has none, made from the keys of all lemmas.
+        """
+        if self._sense_index is None:
+            with self.load_report.phase('index.sense') as phase:
+                self._sense_index = load_sense_index(self.wordnet_data_dir)
+                if self._sense_index is None:
+                    self._sense_index = self._lemma_sense_index()
+                phase.lines = len(self._sense_index)
+        return self._sense_index
+
+    def _synsets(self, pos):
+        cache = self.synset_offset_cache[pos]
+        # Lazy caches stream the synsets they haven't loaded yet.
+        return cache.stream() if hasattr(cache, 'stream') else cache.values()
+
+    def _lemma_sense_index(self):
+        sense_index = {}
+        for sense_key, packed_id in self.sense_key_table.items():
+            pos, offset, _ = split_lemma_id(packed_id)
+            sense_index[sense_key] = pos, offset
+        return sense_index
+
+    @property
+    def sense_key_table(self):
+        """
+        The SenseKeyTable of all lemmas, computed in one pass over the
+        synsets when first used. Also sets the key and count of each lemma.
+        """
+        if self._sense_key_table is None:
+            lemma_keys = []
+            with self.load_report.phase('sense keys') as phase:
+                for pos in POS_LIST:
+                    for synset in self._synsets(pos):
+                        # Once per satellite, not for each of its lemmas.
+                        head_lemma = satellite_head(synset) if pos == ADJ_SAT else None
+                        for lemma_index, lemma in enumerate(synset._lemmas):
+                            if lemma._key is None:
+                                lemma._key = format_sense_key(lemma, head_lemma)
+                            if lemma._count is None:
+                                lemma._count = self.lemmakey_to_count.get(lemma._key, 0)
+                            lemma_keys.append((lemma_id(pos, synset._offset, lemma_index),
+                                               lemma._key))
+                self._sense_key_table = SenseKeyTable(lemma_keys)
+                phase.lines = len(self._sense_key_table)
+        return self._sense_key_table
+
+    @property
+    def sense_frequencies(self):
+        """
+        The SenseFrequencies of the lemma index, from the counts of the
+        sense keys, built when first used.
+        """
+        if self._sense_frequencies is None:
+            sense_key_table = self.sense_key_table
+            with self.load_report.phase('sense frequencies') as phase:
+                counts = {}
+                for sense_key, packed_id in sense_key_table.items():
+                    count = self.lemmakey_to_count.get(sense_key)
+                    if count:
+                        pos, offset, _ = split_lemma_id(packed_id)
+                        lemma = sense_key[:sense_key.index('%')]
+                        counts[lemma, ADJ if pos == ADJ_SAT else pos, offset] = count
+                self._sense_frequencies = SenseFrequencies(self.lemma_pos_offset_map, counts)
+                phase.lines = len(self._sense_frequencies)
+        return self._sense_frequencies
+
+    @property
+    def verb_frame_index(self):
+        """
+        The verb frame number -> (offsets, lemma_indexes) map, two parallel
+        arrays with the synset offsets and the positions in their synsets
+        of the verb lemmas that take each frame, built when first used.
+        """
+        if self._verb_frame_index is None:
+            verb_frame_index = {}
+            with self.load_report.phase('verb frames') as phase:
+                for phase.lines, synset in enumerate(self._synsets(VERB), 1):
+                    for lemma_index, lemma in enumerate(synset._lemmas):
+                        for frame_id in dict.fromkeys(lemma._frame_ids):
+                            if frame_id not in verb_frame_index:
+                                verb_frame_index[frame_id] = array('i'), array('B')
+                            offsets, lemma_indexes = verb_frame_index[frame_id]
+                            offsets.append(synset._offset)
+                            lemma_indexes.append(lemma_index)
+            self._verb_frame_index = verb_frame_index
+        return self._verb_frame_index
+
+    def prefix_index(self, lang='eng'):
+        """ The PrefixIndex of the lemma names of `lang`, built when first used. """
+        if lang not in self._prefix_indexes:
+            if lang != 'eng':
+                self.load_lang(lang)
+            with self.load_report.phase('prefix index {}'.format(lang)) as phase:
+                if lang == 'eng':
+                    pos_to_names = defaultdict(list)
+                    for lemma, pos_to_offsets in self.lemma_pos_offset_map.items():
+                        for pos in pos_to_offsets:
+                            pos_to_names[pos].append(lemma)
+                else:
+                    pos_to_names = self.lang_to_lemmas_to_offsets[lang]
+                self._prefix_indexes[lang] = PrefixIndex(pos_to_names)
+                phase.lines = len(self._prefix_indexes[lang])
+        return self._prefix_indexes[lang]
+
+    @property
+    def fuzzy_index(self):
+        """ The FuzzyIndex of the lemma names, built when first used. """
+        if self._fuzzy_index is None:
+            with self.load_report.phase('fuzzy index') as phase:
+                self._fuzzy_index = FuzzyIndex(self.lemma_pos_offset_map)
+                phase.lines = len(self._fuzzy_index)
+        return self._fuzzy_index
+
+    def load_lang(self, lang):
+        """ Loads the OMW lemmas of `lang`, unless they are already loaded. """
+        if lang in self.lang_to_lemmas_to_offsets and lang in self.lang_to_offsets_to_lemma:
+            return
+        with self.load_report.phase('omw {}'.format(lang)) as phase:
+            offsets_to_lemmas, lemmas_to_offsets = OpenMultilingualWordNet.custom_lemmas(lang)
+            phase.lines = sum(len(lemmas) for offsets in offsets_to_lemmas.values()
+                              for lemmas in offsets.values())
+        self.lang_to_offsets_to_lemma[lang] = offsets_to_lemmas
+        self.lang_to_lemmas_to_offsets[lang] = lemmas_to_offsets
+
+
+def store_key(wordnet_data_dir, lexname_type, backend):
+    return os.path.realpath(wordnet_data_dir), lexname_type, backend
+
+
+def get_store(key):
+    """ The store registered under `key`, or None if there is none yet. """
+    return _stores.get(key)
+
+
+def register_store(key, store):
+    """ Registers a fully loaded store to be shared under `key`. """
+    _stores[key] = store
+    return store
+
+
+def default_store():
+    """
+    The store used by the module level functions (e.g. `wn.morphy.morphy()`)
+    when none is passed in: that of the default `wordnet_dir`, loaded when
+    first needed unless a WordNet already registered it.
+    """
+    global _default_store
+    if _default_store is None:
+        store = get_store(store_key(wordnet_dir, None, 'eager'))
+        if store is None:
+            # `wn` imports this module.
+            from wn import WordNet
+            store = WordNet(wordnet_dir)._store
+        _default_store = store
+    return _default_store
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Streaming access to the synsets of the ``data.*`` files.
+
+`iter_synset_records()` reads a data file (or every data file of a
+directory) line by line and yields one `SynsetRecord` per synset, without
+creating Synset objects in, or otherwise touching, a `WordNet`'s synset
+cache, so scanning all of WordNet runs in constant memory.
+"""
+
+import io
+import os
+from collections import namedtuple
+
+from wn.constants import _FILEMAP
+from wn.lazy import DataFile
+from wn.reader import parse_gloss, parse_index_line, parse_wordnet_line
+from wn.reader import split_syntactic_marker
+from wn.store import WordNetStore, get_store, store_key
+from wn.utils import WordNetError
+
+#: `lemmas` are the lemma names, fields that weren't selected are None.
+SynsetRecord = namedtuple('SynsetRecord', ['offset', 'pos', 'name', 'lexname',
+                                           'lemmas', 'definition', 'examples'])
+
+#: The fields that can be read without parsing the rest of the line,
+#: 'gloss' selects both the definition and the examples.
+FIELDS = ('offset', 'pos', 'lemmas', 'gloss')
+
+
+def _data_filenames(path):
+    if not os.path.isdir(path):
+        return [path]
+    return [os.path.join(path, 'data.{}'.format(pos_tag)) for pos_tag in _FILEMAP.values()]
+
+
+def _index_store(wordnet_data_dir, lexname_type):
+    """
+    A store with the lemma index of `wordnet_data_dir`, which synset names
+    are looked up in: an already loaded one or one holding only the index.
+    """
+    for backend in ('eager', 'lazy', 'mmap'):
+        store = get_store(store_key(wordnet_data_dir, lexname_type, backend))
+        if store is not None:
+            return store
+    store = WordNetStore(wordnet_data_dir, lexname_type)
+    for pos_tag in _FILEMAP.values():
+        filename = os.path.join(wordnet_data_dir, 'index.{}'.format(pos_tag))
+        with io.open(filename, encoding='utf8') as fin:
+            for line in fin:
+                if line.startswith(' '):
+                    continue
+                lemma, pos, synset_offsets = parse_index_line(line)
+                store.lemma_pos_offset_map[lemma][pos] = synset_offsets
+                if pos == 'a':
+                    store.lemma_pos_offset_map[lemma]['s'] = synset_offsets
+    return store
+
+
+def _select_fields(line, fields):
+    """ Parses only the `fields` of a data file line into a SynsetRecord. """
+    offset = pos = lemmas = definition = examples = None
+    columns_str, _, gloss = line.partition('|')
+    if 'gloss' in fields:
+        definition, examples = parse_gloss(gloss.strip())
+    if 'lemmas' in fields:
+        offset_str, lexname_index, pos_str, n_lemmas, *the_rest = columns_str.split()
+        # The index files have no parentheses, so these are syntactic markers.
+        lemmas = [split_syntactic_marker(lemma_name)[0]
+                  for lemma_name in the_rest[:int(n_lemmas, 16)*2:2]]
+    else:
+        offset_str, lexname_index, pos_str = columns_str.split(None, 3)[:3]
+    if 'offset' in fields:
+        offset = int(offset_str)
+    if 'pos' in fields:
+        pos = pos_str
+    return SynsetRecord(offset, pos, None, None, lemmas, definition, examples)
+
+
+def iter_synset_records(path, fields=None, lexname_type=None, store=None):
+    """
+    Yields a SynsetRecord for each synset of the data file `path`, or of
+    all data files if `path` is a WordNet data directory, in file order.
+
+    :param fields: Parses only these of `FIELDS` instead of whole lines,
+    which also skips loading the lemma index that synset names need.
+    :param store: The store whose lemma index and lexnames the synset names
+    are made from, by default a loaded store of the data directory or else
+    one with only its lemma index.
+    """
+    if fields is not None:
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise WordNetError('Unknown synset record fields: {}'.format(
+                ', '.join(sorted(unknown))))
+    filenames = _data_filenames(path)
+    if fields is None and store is None:
+        store = _index_store(os.path.dirname(filenames[0]) or '.', lexname_type)
+
+    for filename in filenames:
+        for line in DataFile(filename):
+            if fields is not None:
+                yield _select_fields(line, fields)
+                continue
+            try:
+                synset, lemmas = parse_wordnet_line(line, lexname_type=lexname_type,
+                                                    store=store)
+            except:
+                err_msg = "Error parsing this line from {}:\n".format(os.path.basename(filename))
+                raise WordNetError(err_msg + line)
+            yield SynsetRecord(synset._offset, synset._pos, synset._name, synset._lexname,
+                               [lemma._name for lemma in lemmas],
+                               synset._definition, synset._examples)
@@ -6,7 +6,6 @@
 # For license information, see LICENSE.TXT
 
 import math
-from itertools import chain
 from operator import itemgetter
 from collections import defaultdict
 
@@ -14,30 +13,57 @@ import wn.path
 from wn.constants import *
 from wn.lemma import Lemma
 from wn.morphy import morphy
-from wn.omw import OpenMultilingualWordNet as OMW
 from wn.utils import WordNetObject, WordNetError
-from wn.utils import breadth_first, FakeSynset
+from wn.utils import breadth_first, split_gloss, FakeSynset
 
-class Synset(WordNetObject):
-    def __init__(self, offset, pos, name, lexname_index, lexname,
-                 definition, examples=None, pointers=None,
-                 lemmas=None, wordnet_line=None):
+def pack_pointers(pointers):
+    """
+    Packs a `symbol -> targets` dictionary into a tuple of
+    `(symbol, tuple(targets))` pairs. Already packed pointers are returned
+    as they are.
+    """
+    if not pointers:
+        return ()
+    if isinstance(pointers, tuple):
+        return pointers
+    return tuple((symbol, tuple(targets)) for symbol, targets in pointers.items())
+
+
+class BaseSynset(WordNetObject):
+    """
+    The attributes and methods shared by all synsets. Subclasses decide how
+    the gloss, pointers and verb frames are kept and provide them as
+    `_definition`, `_examples`, `_packed_pointers` and `_frame_ids`.
+    """
+    __slots__ = ('_offset', '_pos', '_name', '_lexname', '_lemmas',
+                 # The WordNetStore this synset was loaded into.
+                 '_store',
+                 # Computed on the fly by `_init_hypernym_paths()`.
+                 '_hyperpaths', '_min_depth', '_max_depth',
+                 '_root_hypernyms', '_hypernyms_set')
 
+    def __init__(self, offset, pos, name, lexname, lemmas=None, store=None):
         self._offset = offset
         self._pos = pos
         self._name = name
         self._lexname = lexname  # lexicographer name.
-
-        self._definition = definition
-        self._examples = examples if examples else []
-
-        self._pointers = pointers if pointers else defaultdict(set)
         self._lemmas = lemmas
+        for lemma in lemmas or ():
+            lemma._synset = self
+        self._store = store
 
-        self._wordnet_line = wordnet_line
+        self._hyperpaths = None
+
+    @property
+    def _pointers(self):
+        """ The pointers as a `symbol -> set((pos, offset))` dictionary. """
+        pointers = defaultdict(set)
+        for symbol, targets in self._packed_pointers:
+            pointers[symbol] = set(targets)
+        return pointers
 
     def __repr__(self):
-        return "%s('%s')" % (type(self).__name__, self._name)
+        return "%s('%s')" % (Synset.__name__, self._name)
 
     def offset(self):
         return self._offset
@@ -57,6 +83,9 @@ class Synset(WordNetObject):
     def lexname(self):
         return self._lexname
 
+    def frame_ids(self):
+        return list(self._frame_ids)
+
     def _needs_root(self): # Assumes Wordnet >=V3.0.
         if self._pos == NOUN:
             return False
@@ -68,13 +97,6 @@ class Synset(WordNetObject):
         if lang == 'eng':
             return self._lemmas
         else:
-            if lang not in _lang_to_lemmas_to_offsets.keys():
-                # If not in cache, temporarily create an OMW object.
-                # Get the mappings from the staticmethod `custom_lemmas()`
-                offsets_to_lemmas, lemmas_to_offsets = OMW.custom_lemmas(lang)
-                # Load it up.
-                _lang_to_offsets_to_lemma[lang] = offsets_to_lemmas
-                _lang_to_lemmas_to_offsets[lang] = lemmas_to_offsets
             # Return the list of lemmas from the OMW cache.
             lemmark = []
             for lemma_name in self.lemma_names(lang):
@@ -87,6 +109,7 @@ class Synset(WordNetObject):
                 lemma = Lemma(_name, _lexname_index, _lex_id, _syntactic_marker,
                               _synset_offset, _synset_pos, _synset_name,
                               lemma_pointers=None, lang=lang)
+                lemma._synset = self
                 lemmark.append(lemma)
             return lemmark
 
@@ -94,37 +117,41 @@ class Synset(WordNetObject):
         if lang == 'eng':
             return [l._name for l in self._lemmas]
         else:
-            if lang not in _lang_to_lemmas_to_offsets.keys():
-                # If not in cache, temporarily create an OMW object.
-                # Get the mappings from the staticmethod `custom_lemmas()`
-                offsets_to_lemmas, lemmas_to_offsets = OMW.custom_lemmas(lang)
-                # Load it up.
-                _lang_to_offsets_to_lemma[lang] = offsets_to_lemmas
-                _lang_to_lemmas_to_offsets[lang] = lemmas_to_offsets
+            # Loads the OMW lemmas if they're not in the cache yet.
+            self._store.load_lang(lang)
+            lang_to_offsets_to_lemma = self._store.lang_to_offsets_to_lemma
 
             # Return the list of lemmas from the OMW cache.
-            if self._pos in _lang_to_offsets_to_lemma[lang]:
-                return _lang_to_offsets_to_lemma[lang][self._pos][self._offset]
-            elif self._pos == 's' and 'a' in _lang_to_offsets_to_lemma[lang]:
-                return _lang_to_offsets_to_lemma[lang]['a'][self._offset]
+            if self._pos in lang_to_offsets_to_lemma[lang]:
+                return lang_to_offsets_to_lemma[lang][self._pos][self._offset]
+            elif self._pos == 's' and 'a' in lang_to_offsets_to_lemma[lang]:
+                return lang_to_offsets_to_lemma[lang]['a'][self._offset]
             else:
                 return []
 
     def _related(self, relation_symbol, sort=True):
-        if relation_symbol not in self._pointers:
+        # The relation graph keeps the related synsets already sorted.
+        relation_graph = self._store.relation_graph
+        if relation_graph is not None and self in relation_graph:
+            return relation_graph.related(self, relation_symbol)
+        for symbol, targets in self._packed_pointers:
+            if symbol == relation_symbol:
+                break
+        else:
             return []
+        synset_offset_cache = self._store.synset_offset_cache
         related_synsets = []
-        for pos, offset in self._pointers[relation_symbol]:
+        for pos, offset in targets:
             if pos in ['s', 'a']:
                 try:
-                    related_synset = _synset_offset_cache['a'][offset]
+                    related_synset = synset_offset_cache['a'][offset]
                 except:
                     try:
-                        related_synset = _synset_offset_cache['s'][offset]
+                        related_synset = synset_offset_cache['s'][offset]
                     except:
                         raise WordNetError('Part-of-Speech and Offset combination not found in WordNet: {} + {}'.format(pos, offset))
             else:
-                related_synset = _synset_offset_cache[pos][offset]
+                related_synset = synset_offset_cache[pos][offset]
             related_synsets.append(related_synset)
 
         return sorted(related_synsets) if sort else related_synsets
@@ -136,57 +163,104 @@ class Synset(WordNetObject):
         :return: A list of lists, where each list gives the node sequence
         connecting the initial ``Synset`` node and a root node.
         """
-        paths = []
-        hypernyms = self.hypernyms() + self.instance_hypernyms()
-        if len(hypernyms) == 0:
-            paths  = [[self]]
-        for hypernym in hypernyms:
-            for ancestor_list in hypernym._hypernym_paths():
-                ancestor_list.append(self)
-                paths.append(ancestor_list)
-        return paths
+        return self.hypernym_paths()
 
     def _init_hypernym_paths(self):
         """
         Note: This can only be done after the whole wordnet is read, so
         this will be called on the fly when user tries to access:
         (i) _hyperpaths, (ii) _min_depth, (iii) _max_depth or (iv) _root_hypernyms
+
+        The ancestors are visited iteratively in post-order, so that the
+        paths of each synset are derived from the already computed (and
+        kept) ones of its hypernyms instead of walking up to the root again.
+        Each path is kept as a `(synset, parent path)` pair ending at the
+        path of its hypernym, so all synsets below share their ancestors'
+        paths; `hypernym_paths()` makes them into lists.
         """
-        self._hyperpaths = self._hypernym_paths()
-        # Compute the path related statistics.
-        if self._hyperpaths:
-            self._min_depth = min(len(path) for path in self._hyperpaths) - 1
-            self._max_depth = max(len(path) for path in self._hyperpaths) - 1
+        # (synset, None) before its hypernyms are pushed, then
+        # (synset, hypernyms) once they are.
+        stack = [(self, None)]
+        # The ids of the synsets whose hypernyms are still on the stack,
+        # `id()` because hashing synsets hashes their names.
+        visiting = set()
+        while stack:
+            synset, hypernyms = stack.pop()
+            if synset._hyperpaths is not None:
+                continue
+            if hypernyms is None:
+                if id(synset) in visiting:
+                    raise WordNetError('Hypernym cycle through {}'.format(synset))
+                visiting.add(id(synset))
+                hypernyms = synset.hypernyms() + synset.instance_hypernyms()
+                stack.append((synset, hypernyms))
+                stack.extend((hypernym, None) for hypernym in reversed(hypernyms)
+                             if hypernym._hyperpaths is None)
+            else:
+                synset._set_hypernym_paths(hypernyms)
+                visiting.discard(id(synset))
+
+    def _set_hypernym_paths(self, hypernyms):
+        """ Computes the path statistics from those of the `hypernyms`. """
+        if hypernyms:
+            hyperpaths = tuple((self, path) for hypernym in hypernyms
+                               for path in hypernym._hyperpaths)
+            self._min_depth = min(hypernym._min_depth for hypernym in hypernyms) + 1
+            self._max_depth = max(hypernym._max_depth for hypernym in hypernyms) + 1
+            # Initialize the hypernyms_set for `common_hypernyms()`
+            self._hypernyms_set = set(hypernyms)
+            for hypernym in hypernyms:
+                self._hypernyms_set.update(hypernym._hypernyms_set)
+            # Compute the store the root hypernyms.
+            self._root_hypernyms = list(set(root for hypernym in hypernyms
+                                            for root in hypernym._root_hypernyms))
         else:
+            hyperpaths = ((self, None),)
             self._min_depth = self._max_depth = 0
-        # Compute the store the root hypernyms.
-        self._root_hypernyms = list(set([path[0] for path in self._hyperpaths]))
-        # Initialize the hypernyms_set for `common_hypernyms()`
-        self._hypernyms_set = set(chain(*self._hyperpaths))
-        self._hypernyms_set.remove(self)
+            self._hypernyms_set = set()
+            self._root_hypernyms = [self]
+        # Set last, the other attributes are only valid once this is set.
+        self._hyperpaths = hyperpaths
 
     def hypernym_paths(self):
-        if not hasattr(self, '_hyperpaths'):
+        """
+        The paths from the roots to this synset, as lists of synsets.
+
+        The lists are built from the shared linked paths on every call, in
+        time proportional to their total length, rather than memoized:
+        keeping them would cost a list per path of every synset visited,
+        which the linked paths avoid, and callers get lists they may modify.
+        Keep the result when calling this repeatedly for the same synset.
+        """
+        if self._hyperpaths is None:
             self._init_hypernym_paths()
-        return self._hyperpaths
+        paths = []
+        for path in self._hyperpaths:
+            synsets = []
+            while path is not None:
+                synset, path = path
+                synsets.append(synset)
+            synsets.reverse()
+            paths.append(synsets)
+        return paths
 
     def min_depth(self):
-        if not hasattr(self, '_min_depth'):
+        if self._hyperpaths is None:
             self._init_hypernym_paths()
         return self._min_depth
 
     def max_depth(self):
-        if not hasattr(self, '_max_depth'):
+        if self._hyperpaths is None:
             self._init_hypernym_paths()
         return self._max_depth
 
     def root_hypernyms(self):
-        if not hasattr(self, '_root_hypernyms'):
+        if self._hyperpaths is None:
             self._init_hypernym_paths()
         return self._root_hypernyms
 
     def hypernyms_set(self):
-        if not hasattr(self, '_hypernyms_set'):
+        if self._hyperpaths is None:
             self._init_hypernym_paths()
         return self._hypernyms_set
 
@@ -268,3 +342,51 @@ class Synset(WordNetObject):
             fake_synset_distance = max(distances, key=itemgetter(1))[1]
             distances.add((fake_synset, fake_synset_distance + 1))
         return distances
+
+
+class Synset(BaseSynset):
+    __slots__ = ('_definition', '_examples', '_packed_pointers',
+                 # The verb frames of all the lemmas, one byte each.
+                 '_frame_ids')
+
+    def __init__(self, offset, pos, name, lexname_index, lexname,
+                 definition, examples=None, pointers=None, lemmas=None,
+                 store=None, frame_ids=b''):
+        BaseSynset.__init__(self, offset, pos, name, lexname, lemmas, store)
+
+        self._definition = definition
+        self._examples = examples if examples else []
+
+        # `symbol -> targets` packed into a tuple of pairs, see `_pointers`.
+        self._packed_pointers = pack_pointers(pointers)
+        self._frame_ids = frame_ids
+
+
+class LazyGlossSynset(BaseSynset):
+    """
+    A Synset that keeps its raw gloss and splits it into the definition and
+    the examples the first time either of them is used.
+    """
+    __slots__ = ('_packed_pointers', '_frame_ids',
+                 # The raw gloss, replaced by the (definition, examples) once split.
+                 '_gloss')
+
+    def __init__(self, offset, pos, name, lexname_index, lexname,
+                 gloss, pointers=None, lemmas=None, store=None, frame_ids=b''):
+        BaseSynset.__init__(self, offset, pos, name, lexname, lemmas, store)
+        self._gloss = gloss
+        self._packed_pointers = pack_pointers(pointers)
+        self._frame_ids = frame_ids
+
+    def _split_gloss(self):
+        if isinstance(self._gloss, str):
+            self._gloss = split_gloss(self._gloss)
+        return self._gloss
+
+    @property
+    def _definition(self):
+        return self._split_gloss()[0]
+
+    @property
+    def _examples(self):
+        return self._split_gloss()[1]
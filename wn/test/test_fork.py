@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for preloading WordNet before forking workers.
+"""
+
+import gc
+import os
+import traceback
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+
+our_wn = WordNet(wordnet_30_dir)
+
+WORDS = ['dog', 'cat', 'bank', 'run', 'good', 'church', 'book', 'quickly',
+         'geese', 'running', 'better', 'able', 'saw', 'leaves', 'car', 'bus']
+
+def private_dirty_kb():
+    with open('/proc/self/smaps_rollup') as fin:
+        for line in fin:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+
+
+def child_memory_growth(wordnet, rounds=50):
+    """
+    Forks a child that looks up `WORDS` `rounds` times, running a full
+    garbage collection after each round, and returns how much of its memory
+    (in kB) stopped being shared with the parent meanwhile.
+    """
+    read_fd, write_fd = os.pipe()
+    err_read_fd, err_write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            before = private_dirty_kb()
+            for _ in range(rounds):
+                for word in WORDS:
+                    for synset in wordnet.synsets(word):
+                        synset.hypernyms()
+                        [lemma.count() for lemma in synset.lemmas()]
+                gc.collect()
+            os.write(write_fd, str(private_dirty_kb() - before).encode())
+            status = 0
+        except BaseException:
+            # Not through sys.stderr, which the test runner may capture.
+            os.write(err_write_fd, traceback.format_exc().encode())
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    os.close(err_write_fd)
+    # The child only writes its output once done, so reading its errors
+    # first can't block it.
+    with os.fdopen(err_read_fd) as fin:
+        errors = fin.read()
+    with os.fdopen(read_fd) as fin:
+        output = fin.read()
+    _, status = os.waitpid(pid, 0)
+    assert status == 0, 'The child failed with status {}:\n{}'.format(status, errors)
+    growth = int(output)
+    return growth
+
+
+@unittest.skipUnless(hasattr(os, 'fork') and hasattr(gc, 'freeze') and
+                     os.path.exists('/proc/self/smaps_rollup'),
+                     'needs fork(), gc.freeze() and /proc/self/smaps_rollup')
+class TestPreloadForFork(unittest.TestCase):
+    def test_child_memory_stays_flat(self):
+        our_wn.preload_for_fork()
+        try:
+            # Touching a few synsets unshares a few pages, but the garbage
+            # collector no longer walks (and unshares) the whole WordNet,
+            # which alone would copy about half of the parent's memory.
+            assert child_memory_growth(our_wn) < private_dirty_kb() / 8
+        finally:
+            gc.unfreeze()
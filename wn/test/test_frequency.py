@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the frequency ranked synsets.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import POS_LIST, wordnet_30_dir
+from wn.frequency import SenseFrequencies
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestFrequency(unittest.TestCase):
+    def test_sense_frequencies(self):
+        lemma_pos_offset_map = {'dog': {'n': [1, 2, 3], 'v': [4]},
+                                'good': {'a': [5, 6], 's': [5, 6], 'r': [7]}}
+        counts = {('dog', 'n', 3): 5, ('dog', 'n', 2): 1, ('good', 'a', 6): 2}
+        sense_frequencies = SenseFrequencies(lemma_pos_offset_map, counts)
+        assert len(sense_frequencies) == 7
+        assert [list(run) for run in sense_frequencies.ranked('dog', 'n')] == [[3, 2, 1], [5, 1, 0]]
+        assert [list(run) for run in sense_frequencies.ranked('dog', 'v')] == [[4], [0]]
+        assert [list(run) for run in sense_frequencies.ranked('good', 's')] == [[6, 5], [2, 0]]
+        assert [list(run) for run in sense_frequencies.ranked('good', 'r')] == [[7], [0]]
+        assert [list(run) for run in sense_frequencies.ranked('dog', 'a')] == [[], []]
+        assert [list(run) for run in sense_frequencies.ranked('cat', 'n')] == [[], []]
+
+    def test_by_frequency(self):
+        def count(synset, form):
+            return sum(lemma.count() for lemma in synset.lemmas() if lemma.name().lower() == form)
+        for word in ['dogs', 'run', 'bank', 'good', 'beautiful', 'quickly', 'xyzzy']:
+            for pos in [None] + POS_LIST:
+                synsets = our_wn.synsets(word, pos)
+                ranked = our_wn.synsets(word, pos, by_frequency=True)
+                assert sorted(ranked) == sorted(synsets)
+                forms = {p: our_wn.morphy(word, p) for p in POS_LIST}
+                counts = [count(ss, forms[pos or ss.pos()]) for ss in ranked]
+                assert counts == sorted(counts, reverse=True)
+                assert our_wn.first_sense(word, pos) == (ranked[0] if ranked else None)
+        assert our_wn.synsets('dogs', 'n', by_frequency=True)[:2] == [
+            our_wn.synset('dog.n.01'), our_wn.synset('frump.n.01')]
+        assert our_wn.first_sense('Ran') == our_wn.synset('run.v.01')
+        assert our_wn.first_sense('bank') == our_wn.synset('bank.n.01')
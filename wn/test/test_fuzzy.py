@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the fuzzy lemma name lookup.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.fuzzy import FuzzyIndex, edit_distance
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestFuzzy(unittest.TestCase):
+    def test_edit_distance(self):
+        assert edit_distance('dog', 'dog', 2) == 0
+        assert edit_distance('dog', 'dgo', 2) == 2
+        assert edit_distance('kitten', 'sitting', 3) == 3
+        assert edit_distance('kitten', 'sitting', 1) == 2
+        assert edit_distance('a', 'abcd', 2) == 3
+
+    def test_fuzzy_index(self):
+        names = ['dog', 'dogs', 'do', 'god', 'cat', 'cart', 'act', 'a', 'bog_down']
+        index = FuzzyIndex(names)
+        for word in ['dog', 'dgo', 'ct', 'carts', 'bog_dowm', '', 'xyzzy']:
+            for max_distance in range(3):
+                assert index.search(word, max_distance) == sorted(
+                    (edit_distance(word, name, max_distance), name) for name in names
+                    if edit_distance(word, name, max_distance) <= max_distance)
+        assert index.search('dog') == [(0, 'dog'), (1, 'do'), (1, 'dogs')]
+        with self.assertRaises(WordNetError):
+            index.search('dog', 3)
+
+    def test_fuzzy_synsets(self):
+        assert our_wn.fuzzy_synsets('Dogg', 1, 'n')[:2] == our_wn.synsets('dog', 'n')[:2]
+        assert our_wn.synset('dog.n.01') not in our_wn.fuzzy_synsets('dgo')
+        assert our_wn.synset('dog.n.01') in our_wn.fuzzy_synsets('dgo', 2)
+        # Satellites are adjectives too, as in `synsets()`.
+        assert our_wn.synset('beautiful.s.02') in our_wn.fuzzy_synsets('beautifull', 1, 'a')
+        for pos in ['a', 's']:
+            assert our_wn.fuzzy_synsets('beautifull', 1, pos) == our_wn.synsets('beautiful', pos)
+        synsets = our_wn.fuzzy_synsets('beautifull')
+        assert len(synsets) == len(set(synsets)) == 3
+        assert our_wn.fuzzy_synsets('xyzzyx') == []
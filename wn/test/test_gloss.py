@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the full-text search over glosses.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from array import array
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.gloss import GlossIndex, contains_phrase, gloss_texts, tokenize
+from wn.snapshot import load_snapshot
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestGloss(unittest.TestCase):
+    def test_tokenize(self):
+        assert tokenize("A dog's bark, e.g. 'Woof-woof'") == ['a', 'dog', 's', 'bark', 'e', 'g', 'woof', 'woof']
+        assert contains_phrase(['the cat', 'the big dog barks'], ['big', 'dog'])
+        assert not contains_phrase(['the big', 'dog barks'], ['big', 'dog'])
+
+    def test_search_glosses(self):
+        synsets = list(our_wn.all_synsets())[:2000]
+        words = [set(tokenize(' '.join(gloss_texts(ss)))) for ss in synsets]
+        index = GlossIndex(synsets)
+        for query in ['the', 'of a', 'a  Person', 'of the', 'xyzzy', '']:
+            tokens = tokenize(query)
+            assert index.search(tokens, 'and') == [
+                (ss._pos, ss._offset) for ss, ws in zip(synsets, words)
+                if tokens and all(token in ws for token in tokens)]
+            assert index.search(tokens, 'or') == [
+                (ss._pos, ss._offset) for ss, ws in zip(synsets, words)
+                if any(token in ws for token in tokens)]
+        dog = our_wn.synset('dog.n.01')
+        assert dog in our_wn.search_glosses('genus Canis')
+        assert dog in our_wn.search_glosses('Canis OR xyzzy', 'or')
+        assert dog not in our_wn.search_glosses('Canis xyzzy')
+        assert dog in our_wn.search_glosses('the dog barked all night', 'phrase')
+        assert dog not in our_wn.search_glosses('night all', 'phrase')
+        assert our_wn.search_glosses('United States', 'phrase') == [
+            ss for ss in our_wn.search_glosses('United States')
+            if contains_phrase(gloss_texts(ss), ['united', 'states'])]
+        with self.assertRaises(WordNetError):
+            our_wn.search_glosses('dog', 'not')
+
+    def test_gloss_index_snapshot(self):
+        gloss_index = our_wn._store.gloss_index or our_wn.build_gloss_index()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            our_wn.save_snapshot(filename)
+            tables = load_snapshot(filename, wordnet_30_dir, None)
+        snapshot_index = GlossIndex.from_table(tables['gloss_index'])
+        assert len(snapshot_index) == len(gloss_index)
+        for tokens in [['dog'], ['of', 'the'], ['xyzzy']]:
+            for operator in ['and', 'or']:
+                assert snapshot_index.search(tokens, operator) == gloss_index.search(tokens, operator)
+
+    def test_gloss_table_layout(self):
+        synsets = list(our_wn.all_synsets())[:500]
+        index = GlossIndex(synsets)
+        table = index.to_table()
+        # A table from a machine of the other byte order.
+        swapped = dict(table, byteorder='big' if sys.byteorder == 'little' else 'little')
+        offsets = array('I', table['offsets'])
+        offsets.byteswap()
+        swapped['offsets'] = offsets.tobytes()
+        postings = {}
+        for token, posting in table['postings'].items():
+            values = array('I', posting)
+            values.byteswap()
+            postings[token] = values.tobytes()
+        swapped['postings'] = postings
+        swapped_index = GlossIndex.from_table(swapped)
+        for tokens in [['dog'], ['of', 'the']]:
+            assert swapped_index.search(tokens) == index.search(tokens)
+        with self.assertRaises(WordNetError):
+            GlossIndex.from_table(dict(table, itemsize=table['itemsize'] * 2))
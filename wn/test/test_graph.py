@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the array-backed relation graph.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.graph import RelationGraph
+from wn.path import WordNetPaths
+
+our_wn = WordNet(wordnet_30_dir)
+graph = RelationGraph(our_wn.all_synsets())
+
+class TestRelationGraph(unittest.TestCase):
+    def test_related(self):
+        assert len(graph) == 117659
+        for ss in our_wn.all_synsets('n'):
+            for symbol in ('@', '@i', '~', '#m', '%p'):
+                assert graph.related(ss, symbol) == ss._related(symbol)
+
+    def test_shortest_path_distance(self):
+        paths = WordNetPaths()
+        pairs = [('car.n.01', 'bus.n.01'), ('dog.n.01', 'cat.n.01'),
+                 ('run.v.01', 'dog.n.01'), ('run.v.01', 'walk.v.01')]
+        for name1, name2 in pairs:
+            ss1, ss2 = our_wn.synset(name1), our_wn.synset(name2)
+            for simulate_root in (False, True):
+                assert (graph.shortest_path_distance(ss1, ss2, simulate_root) ==
+                        paths.shortest_path_distance(ss1, ss2, simulate_root))
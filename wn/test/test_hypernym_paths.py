@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the hypernym paths and depths.
+"""
+
+import unittest
+from collections import defaultdict
+from itertools import chain
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.synset import Synset
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+
+def recursive_hypernym_paths(synset):
+    paths = []
+    hypernyms = synset.hypernyms() + synset.instance_hypernyms()
+    if len(hypernyms) == 0:
+        paths = [[synset]]
+    for hypernym in hypernyms:
+        for ancestor_list in recursive_hypernym_paths(hypernym):
+            ancestor_list.append(synset)
+            paths.append(ancestor_list)
+    return paths
+
+
+class ChainStore:
+    """ A store of noun synsets where synset i has synset i+1 as hypernym. """
+    def __init__(self, n_synsets, cycle=False):
+        self.relation_graph = None
+        self.synset_offset_cache = defaultdict(dict)
+        for i in range(n_synsets):
+            target = i + 1 if i + 1 < n_synsets else (0 if cycle else None)
+            pointers = {'@': [('n', target)]} if target is not None else None
+            self.synset_offset_cache['n'][i] = Synset(i, 'n', 'synset.n.{}'.format(i), 0, 'noun.Tops',
+                                                      '', pointers=pointers, lemmas=[], store=self)
+
+
+class TestHypernymPaths(unittest.TestCase):
+    def test_hypernym_paths(self):
+        for name in ['dog.n.01', 'person.n.01', 'einstein.n.01', 'paris.n.01',
+                     'entity.n.01', 'run.v.01', 'good.a.01']:
+            synset = our_wn.synset(name)
+            paths = recursive_hypernym_paths(synset)
+            assert synset.hypernym_paths() == paths
+            assert synset._hypernym_paths() == paths
+            assert synset.min_depth() == min(len(path) for path in paths) - 1
+            assert synset.max_depth() == max(len(path) for path in paths) - 1
+            assert set(synset.root_hypernyms()) == set(path[0] for path in paths)
+            assert synset.hypernyms_set() == set(chain(*paths)) - {synset}
+        assert our_wn.synset('dog.n.01').min_depth() == 8
+        assert our_wn.synset('dog.n.01').max_depth() == 13
+        # The ancestors kept their paths, which the descendants share.
+        canine = our_wn.synset('canine.n.02')
+        assert canine._hyperpaths is not None
+        dog = our_wn.synset('dog.n.01')
+        assert dog.hypernyms()[0] is canine
+        assert all(dog_path[1] is canine_path for dog_path, canine_path
+                   in zip(dog._hyperpaths, canine._hyperpaths))
+        # Each call builds new lists.
+        dog.hypernym_paths()[0].append(None)
+        assert dog.hypernym_paths() == recursive_hypernym_paths(dog)
+
+    def test_deep_and_cyclic_hierarchies(self):
+        store = ChainStore(5000)
+        bottom = store.synset_offset_cache['n'][0]
+        assert bottom.max_depth() == bottom.min_depth() == 4999
+        assert len(bottom.hypernym_paths()[0]) == 5000
+        assert bottom.root_hypernyms() == [store.synset_offset_cache['n'][4999]]
+        with self.assertRaises(WordNetError):
+            ChainStore(10, cycle=True).synset_offset_cache['n'][3].hypernym_paths()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for lazily loaded and memory-mapped synsets.
+"""
+
+import gc
+import unittest
+import warnings
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.lazy import DataFile
+from wn.mapped import MappedDataFile, parse_mapped_line
+from wn.reader import parse_wordnet_line
+
+lazy_wn = WordNet(wordnet_30_dir, lazy=True)
+
+class TestLazySynsets(unittest.TestCase):
+    def test_line_at(self):
+        with DataFile(wordnet_30_dir + 'data.noun') as data_file:
+            line = data_file.line_at(2084071)
+            assert line.startswith('02084071 05 n 03 dog 0 domestic_dog 0 Canis_familiaris 0')
+            # Offsets that don't start a synset line.
+            assert data_file.line_at(2084072) is None
+            assert data_file.line_at(0) is None
+        assert data_file._fin is None
+
+    def test_data_file_closed(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            data_file = DataFile(wordnet_30_dir + 'data.noun')
+            assert data_file.line_at(2084071) is not None
+            del data_file
+            gc.collect()
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    def test_lazy_lookups(self):
+        dog = lazy_wn.synset('dog.n.01')
+        assert dog.lemma_names() == ['dog', 'domestic_dog', 'Canis_familiaris']
+        assert [ss.name() for ss in dog.hypernyms()] == ['canine.n.02', 'domestic_animal.n.01']
+        assert [ss.name() for ss in lazy_wn.synsets('dog')] == [
+            'dog.n.01', 'frump.n.01', 'dog.n.03', 'cad.n.01', 'frank.n.02',
+            'pawl.n.01', 'andiron.n.01', 'chase.v.01']
+        # Satellite adjectives share data.adj with plain adjectives.
+        assert lazy_wn.synset('good.s.06').pos() == 's'
+        assert lazy_wn.synset('good.a.01').pos() == 'a'
+
+    def test_all_synsets_streaming(self):
+        assert sum(1 for _ in lazy_wn.all_synsets('v')) == 13767
+        assert all(ss.pos() == 's' for ss in lazy_wn.all_synsets('s'))
+
+
+mapped_wn = WordNet(wordnet_30_dir, mmap=True)
+
+class TestMappedSynsets(unittest.TestCase):
+    def test_mapped_line_at(self):
+        with MappedDataFile(wordnet_30_dir + 'data.noun') as data_file, \
+             DataFile(wordnet_30_dir + 'data.noun') as plain_data_file:
+            assert data_file.line_at(2084071) == plain_data_file.line_at(2084071)
+            assert data_file.line_at(2084072) is None
+            assert data_file.line_at(len(data_file.mapping) + 10) is None
+
+    def test_mapped_synset(self):
+        data_file = MappedDataFile(wordnet_30_dir + 'data.noun')
+        mapped_dog = parse_mapped_line(data_file, data_file.line_at(2084071),
+                                       store=mapped_wn._store)
+        dog, lemmas = parse_wordnet_line(data_file.line_at(2084071), store=lazy_wn._store)
+        assert mapped_dog.name() == dog.name() == 'dog.n.01'
+        assert mapped_dog.definition() == dog.definition()
+        assert mapped_dog.examples() == dog.examples()
+        assert mapped_dog._pointers == dog._pointers
+        for mapped_lemma, lemma in zip(mapped_dog.lemmas(), lemmas):
+            assert mapped_lemma._packed_pointers == lemma._packed_pointers
+        # Parsed once, then kept.
+        assert mapped_dog._packed_pointers is mapped_dog._packed_pointers
+        assert mapped_dog.examples() is mapped_dog.examples()
+        data_file.close()
+
+    def test_mapped_lookups(self):
+        assert mapped_wn.synset('dog.n.01').lemma_names() == ['dog', 'domestic_dog', 'Canis_familiaris']
+        assert [ss.name() for ss in mapped_wn.synset('dog.n.01').hypernyms()] == ['canine.n.02', 'domestic_animal.n.01']
+        assert [l.name() for l in mapped_wn.lemma('good.a.01.good').antonyms()] == ['bad']
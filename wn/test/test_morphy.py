@@ -9,11 +9,17 @@
 Tests for morphy.
 """
 
+import os
+import tempfile
 import unittest
 
 from wn import WordNet
+from wn.constants import POS_LIST, exception_map, lexnames, wordnet_30_dir
+from wn.morphy import MorphyCache, morphy
+from wn.snapshot import load_snapshot
+from wn.store import WordNetStore
 
-from wn.morphy import morphy
+our_wn = WordNet(wordnet_30_dir)
 
 class TestMorphy(unittest.TestCase):
     def test_morphy(self):
@@ -24,3 +30,49 @@ class TestMorphy(unittest.TestCase):
         assert morphy('hardrock', 'r') == None
         assert morphy('book', 'n') == 'book'
         assert morphy('book', 'a') == None
+
+    def test_default_tables(self):
+        # Importable, and read from the default data directory when used.
+        assert exception_map['n']['geese'] == ['goose']
+        assert 'adj.all' in lexnames and lexnames[3] == 'noun.Tops'
+        assert len(lexnames) == len(our_wn.lexnames)
+
+    def test_morphy_store(self):
+        store = WordNetStore(wordnet_30_dir)
+        store.lemma_pos_offset_map = our_wn._lemma_pos_offset_map
+        assert morphy('geese', 'n', store=store) == 'goose'
+        # Each store reads its own exception lists.
+        store.exception_map['n']['geese'] = ['dog']
+        assert morphy('geese', 'n', store=store) == 'dog'
+        assert morphy('geese', 'n') == 'goose'
+
+    def test_morphy_cache(self):
+        cache = MorphyCache(maxsize=2)
+        assert cache.morphy('dogs', 'n', store=our_wn._store) == 'dog'
+        assert cache.morphy('dogs', 'n', store=our_wn._store) == 'dog'
+        assert cache.morphy('geese', store=our_wn._store) == 'goose'
+        assert cache.morphy('xyzzy', 'n', store=our_wn._store) is None
+        # 'dogs' was the least recently used.
+        assert cache.info() == (1, 3, 1, 2, 2)
+        assert cache.morphy('dogs', 'n', store=our_wn._store) == 'dog'
+        assert cache.info().misses == 4
+        wordnet = WordNet(wordnet_30_dir, morphy_cache_size=0)
+        assert wordnet.synsets('dogs') == our_wn.synsets('dogs')
+        assert wordnet.morphy_cache.info().currsize == 0
+
+    def test_inflection_index(self):
+        forms = ['dogs', 'geese', 'abaci', 'churches', 'ran', 'running', 'better',
+                 'happier', 'book', 'booked', 'xyzzy', 'aardwolves', 'hardrock']
+        expected = [[morphy(form, pos) for pos in [None] + POS_LIST] for form in forms]
+        inflection_index = our_wn.build_inflection_index()
+        try:
+            assert 'geese' in inflection_index and 'booked' in inflection_index
+            assert [[morphy(form, pos) for pos in [None] + POS_LIST]
+                    for form in forms] == expected
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+                our_wn.save_snapshot(filename)
+                tables = load_snapshot(filename, wordnet_30_dir, None)
+            assert tables['inflection_index'] == inflection_index
+        finally:
+            our_wn._store.inflection_index = None
@@ -13,6 +13,7 @@ import unittest
 
 from wn import WordNet
 from wn.constants import wordnet_30_dir
+from wn.utils import WordNetError
 
 our_wn = WordNet(wordnet_30_dir)
 
@@ -31,3 +32,9 @@ class TestOMWLemmas(unittest.TestCase):
                 except AssertionError: # We should have more than what NLTK can fetch.
                     print(nltk_ss, our_ss)
                     assert len(set(our_lemma_names).difference(nltk_lemma_names)) > 0
+
+    def test_unsupported_lang(self):
+        with self.assertRaises(WordNetError):
+            our_wn.custom_lemmas('xyz')
+        with self.assertRaises(WordNetError):
+            our_wn.custom_lemmas('xx')
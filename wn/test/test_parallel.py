@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the parallel loader.
+"""
+
+import io
+import unittest
+from unittest import mock
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.parallel import PARALLEL_LOAD_SUPPORTED, file_chunks, parallel_load
+from wn.store import WordNetStore
+from wn.synset import LazyGlossSynset
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestParallelLoad(unittest.TestCase):
+    def test_file_chunks(self):
+        filename = wordnet_30_dir + 'data.verb'
+        chunks = file_chunks(filename, chunk_size=1 << 16)
+        with io.open(filename, 'rb') as fin:
+            data = fin.read()
+        assert len(chunks) > 1
+        assert b''.join(data[start:end] for start, end in chunks) == data
+        # Every chunk ends at a line boundary.
+        assert all(data[end-1:end] == b'\n' for start, end in chunks)
+
+    @unittest.skipUnless(PARALLEL_LOAD_SUPPORTED, 'needs Python 3.7')
+    def test_same_as_serial(self):
+        store = WordNetStore(wordnet_30_dir)
+        parallel_load(store, 2)
+        lemma_pos_offset_map = store.lemma_pos_offset_map
+        synset_offset_cache = store.synset_offset_cache
+        assert lemma_pos_offset_map == our_wn._lemma_pos_offset_map
+        for pos in synset_offset_cache:
+            assert list(synset_offset_cache[pos]) == list(our_wn._synset_offset_cache[pos])
+        dog = synset_offset_cache['n'][2084071]
+        assert dog.name() == 'dog.n.01'
+        assert dog._store is store
+        assert dog._packed_pointers == our_wn.synset('dog.n.01')._packed_pointers
+
+    @unittest.skipUnless(PARALLEL_LOAD_SUPPORTED, 'needs Python 3.7')
+    def test_lazy_gloss(self):
+        store = WordNetStore(wordnet_30_dir)
+        parallel_load(store, 2, lazy_gloss=True)
+        dog = store.synset_offset_cache['n'][2084071]
+        assert isinstance(dog, LazyGlossSynset) and isinstance(dog._gloss, str)
+        our_dog = our_wn.synset('dog.n.01')
+        assert (dog.definition(), dog.examples()) == (our_dog.definition(), our_dog.examples())
+
+    def test_serial_fallback(self):
+        # Before Python 3.7 the files are parsed serially.
+        with mock.patch('wn.PARALLEL_LOAD_SUPPORTED', False), \
+             mock.patch('wn.parallel_load', side_effect=AssertionError):
+            wordnet = WordNet(wordnet_30_dir, lexname_type='clusters', processes=2)
+        assert wordnet.synset('dog.n.01').lemma_names() == ['dog', 'domestic_dog', 'Canis_familiaris']
+
+    def test_unsupported_python(self):
+        with mock.patch('wn.parallel.PARALLEL_LOAD_SUPPORTED', False):
+            with self.assertRaises(WordNetError):
+                parallel_load(WordNetStore(wordnet_30_dir), 2)
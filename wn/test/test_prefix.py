@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the lemma name prefix search.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.prefix import PrefixIndex
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestPrefix(unittest.TestCase):
+    def test_prefix_index(self):
+        index = PrefixIndex({'n': ['dog', 'do', 'dogma', 'cat'], 'v': ['dog', 'dot', 'e']})
+        assert index.search('do') == ['do', 'dog', 'dogma', 'dot']
+        assert index.search('do', 'v') == ['dog', 'dot']
+        assert index.search('dog', limit=2) == ['dog', 'dogma']
+        assert index.search('') == ['cat', 'do', 'dog', 'dogma', 'dot', 'e']
+        assert index.search('x') == index.search('do', 'r') == []
+
+    def test_lemma_names_with_prefix(self):
+        lemma_names = sorted(our_wn.all_lemma_names())
+        for prefix in ['dog', 'Co', 'zy', 'xyzzy']:
+            for pos in [None, 'n', 'v', 'a', 's', 'r']:
+                assert our_wn.lemma_names_with_prefix(prefix, pos) == [
+                    name for name in lemma_names if name.startswith(prefix.lower())
+                    and (pos is None or pos in our_wn._lemma_pos_offset_map[name])]
+        assert our_wn.lemma_names_with_prefix('dog', 'v', limit=3) == ['dog', 'dogfight', 'dogmatise']
+        danish = sorted(our_wn.all_lemma_names('n', lang='dan'))
+        assert our_wn.lemma_names_with_prefix('hun', 'n', lang='dan') == [
+            name for name in danish if name.startswith('hun')]
+        with self.assertRaises(WordNetError):
+            our_wn.lemma_names_with_prefix('hun', lang='xyz')
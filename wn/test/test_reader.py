@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the data file parsers.
+"""
+
+import io
+import os
+import unittest
+
+from wn import WordNet
+from wn.constants import _FILEMAP, wordnet_30_dir, wn_data_dir
+from wn.reader import parse_data_buffer, parse_gloss, parse_wordnet_line, split_gloss
+
+our_wn = WordNet(wordnet_30_dir)
+wn_33 = WordNet(wn_data_dir + 'wordnet-3.3/', lexname_type='clusters')
+lazy_gloss_wn = WordNet(wordnet_30_dir, lazy_gloss=True)
+
+def synset_fields(synset):
+    return (synset._offset, synset._pos, synset._name, synset._lexname,
+            synset._definition, synset._examples, synset._packed_pointers,
+            [(lemma._name, lemma._lexname_index, lemma._lex_id, lemma._syntactic_marker,
+              lemma._synset_name, lemma._packed_pointers) for lemma in synset._lemmas])
+
+
+class TestReader(unittest.TestCase):
+    def test_split_gloss(self):
+        for gloss in [' a dog; "the dog barked"; "dogs bark"  ',
+                      ' (a "quoted" word) and more; "an example"',
+                      ' an unmatched "quote', ' no examples at all ', '']:
+            assert split_gloss(gloss) == parse_gloss(gloss)
+
+    def test_bulk_parser(self):
+        for wordnet in [our_wn, wn_33]:
+            store = wordnet._store
+            for pos_tag in _FILEMAP.values():
+                filename = os.path.join(store.wordnet_data_dir, 'data.{}'.format(pos_tag))
+                with io.open(filename, encoding='utf8') as fin:
+                    buffer = fin.read()
+                lines = [line for line in buffer.split('\n')
+                         if line.strip() and not line.startswith(' ')]
+                synsets = list(parse_data_buffer(buffer, store.lexname_type, store))
+                assert len(synsets) == len(lines)
+                for line, synset in zip(lines, synsets):
+                    expected, _ = parse_wordnet_line(line, lexname_type=store.lexname_type,
+                                                     store=store)
+                    assert synset_fields(synset) == synset_fields(expected)
+
+    def test_unicode_line_breaks(self):
+        # Only newlines end a line, not the other line boundaries of `str.splitlines()`.
+        with io.open(os.path.join(wordnet_30_dir, 'data.noun'), encoding='utf8') as fin:
+            line = next(line for line in fin if line.startswith('02084071'))
+        line = line.replace('a member of the genus Canis',
+                            'a member\x0cof the\u2028genus\x85Canis')
+        synsets = list(parse_data_buffer(line + line, None, our_wn._store))
+        assert len(synsets) == 2
+        assert synsets[0].definition().startswith('a member\x0cof the\u2028genus\x85Canis')
+
+    def test_lazy_gloss(self):
+        assert lazy_gloss_wn._store is not our_wn._store
+        dog = lazy_gloss_wn.synset('dog.n.01')
+        assert isinstance(dog._gloss, str)
+        assert dog.examples() == ['the dog barked all night']
+        assert dog._gloss == (dog.definition(), dog.examples())
+        for synset in our_wn.all_synsets():
+            lazy = lazy_gloss_wn.synset_from_pos_and_offset(synset._pos, synset._offset)
+            assert lazy.definition() == synset.definition()
+            assert lazy.examples() == synset.examples()
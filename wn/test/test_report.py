@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the load phase instrumentation.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir, wordnet_ic_dir
+from wn.info import WordNetInformationContent
+from wn.report import LoadReport
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestLoadReport(unittest.TestCase):
+    def test_wordnet_report(self):
+        phases = {loaded.name: loaded for loaded in our_wn.load_report}
+        for name in ['index.noun', 'index.verb', 'cntlist.rev']:
+            assert phases[name].lines > 0
+            assert phases[name].seconds >= 0
+        our_wn.synsets('geese')
+        assert 'exception map' in [loaded.name for loaded in our_wn.load_report]
+
+    def test_ic_report(self):
+        with self.assertLogs('wn', level='INFO') as logs:
+            ic = WordNetInformationContent('brown')
+        loaded, = ic.load_report
+        assert loaded.name == 'ic-brown.dat'
+        with open(wordnet_ic_dir + '/ic-brown.dat') as fin:
+            assert loaded.lines == len(fin.readlines()) - 1
+        assert 'Loaded ic-brown.dat' in logs.output[0]
+
+    def test_phase(self):
+        report = LoadReport()
+        with report.phase('test') as phase:
+            phase.lines = 3
+        assert [(loaded.name, loaded.lines) for loaded in report] == [('test', 3)]
+        assert 'test' in str(report)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the sense key lookups.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir, load_sense_index
+from wn.sensekeys import SenseKeyTable, lemma_id, split_lemma_id
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestSenseKeys(unittest.TestCase):
+    def test_sense_keys(self):
+        # The lex_id of a key isn't a sense number.
+        assert our_wn.synset_from_sense_key('dog%1:05:00::') == our_wn.synset('dog.n.01')
+        assert our_wn.synset_from_sense_key('dog%1:18:01::') == our_wn.synset('frump.n.01')
+        assert our_wn.lemma_from_key('bonny%5:00:00:beautiful:00').name() == 'bonny'
+        for word in ['dog', 'bank', 'run', 'good', 'beautiful', 'quickly']:
+            for synset in our_wn.synsets(word):
+                for lemma in synset.lemmas():
+                    assert our_wn.lemma_from_key(lemma.key()) is lemma
+                    assert our_wn.synset_from_sense_key(lemma.key()) is synset
+        with self.assertRaises(WordNetError):
+            our_wn.synset_from_sense_key('dog%1:05:99::')
+        with self.assertRaises(WordNetError):
+            our_wn.synset_from_sense_key('dog')
+
+    def test_batch(self):
+        keys = ['dog%1:05:00::', 'no%1:05:00::', 'run%2:38:00::']
+        assert our_wn.synsets_from_sense_keys(keys) == [
+            our_wn.synset('dog.n.01'), None, our_wn.synset('run.v.01')]
+        assert our_wn.lemmas_from_keys(keys) == [
+            our_wn.lemma('dog.n.01.dog'), None, our_wn.lemma('run.v.01.run')]
+
+    @unittest.skipIf(load_sense_index(wordnet_30_dir) is None, 'no index.sense')
+    def test_lemma_keys_match_index_sense(self):
+        sense_index = load_sense_index(wordnet_30_dir)
+        lemma_sense_index = our_wn._store._lemma_sense_index()
+        assert all(lemma_sense_index[key] == pos_offset
+                   for key, pos_offset in sense_index.items())
+
+    def test_sense_key_table(self):
+        table = SenseKeyTable([(lemma_id('s', 5, 1), 'b'), (lemma_id('n', 5, 0), 'a'),
+                               (lemma_id('n', 7, 2), 'c'), (lemma_id('n', 7, 3), 'c')])
+        assert split_lemma_id(lemma_id('s', 1234567, 3)) == ('s', 1234567, 3)
+        assert table.key(lemma_id('s', 5, 1)) == 'b' and table.key(lemma_id('a', 5, 1)) is None
+        assert table.lemma_id('c') == lemma_id('n', 7, 2) and table.lemma_id('d') is None
+        assert [key for key, _ in table.items()] == ['a', 'c', 'c', 'b']
+        # Computed once for all lemmas.
+        sense_key_table = our_wn._store.sense_key_table
+        assert len(sense_key_table) == sum(len(ss.lemmas()) for ss in our_wn.all_synsets())
+        for synset in [our_wn.synset('bonny.s.01'), our_wn.synset('dog.n.01')]:
+            for lemma_index, lemma in enumerate(synset.lemmas()):
+                packed_id = lemma_id(synset.pos(), synset.offset(), lemma_index)
+                assert sense_key_table.key(packed_id) == lemma.key()
+                assert sense_key_table.lemma_id(lemma.key()) == packed_id
+        # Keys that differ in case only resolve to the first of the lemmas.
+        assert [lemma.name() for lemma in our_wn.synset('a.n.06').lemmas()][:2] == ['A', 'a']
+        assert our_wn.lemma_from_key('a%1:10:00::').name() == 'A'
+
+    def test_lazy_lookups(self):
+        # Lazy stores resolve the keys through the synsets, not the table.
+        lazy_wn = WordNet(wordnet_30_dir, lazy=True)
+        assert lazy_wn.lemma_from_key('bonny%5:00:00:beautiful:00').name() == 'bonny'
+        assert lazy_wn.lemma_from_key('a%1:10:00::').name() == 'A'
+        assert [lemma and lemma.name() for lemma in lazy_wn.lemmas_from_keys(
+            ['dog%1:05:00::', 'no%1:05:00::'])] == ['dog', None]
+        with self.assertRaises(WordNetError):
+            lazy_wn.lemma_from_key('dog%1:05:99::')
+        assert lazy_wn._store._sense_key_table is None
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for WordNet snapshots.
+"""
+
+import marshal
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir, wn_data_dir
+from wn.snapshot import _SNAPSHOT_MAGIC, load_snapshot
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestSnapshot(unittest.TestCase):
+    def test_snapshot_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            our_wn.save_snapshot(filename)
+            tables = load_snapshot(filename, wordnet_30_dir, None)
+        assert len(tables['synsets']) == len(list(our_wn.all_synsets()))
+        assert tables['lemmakey_to_count'] == our_wn._lemmakey_to_count
+        for snapshot_ss in tables['synsets']:
+            our_ss = our_wn.synset_from_pos_and_offset(snapshot_ss._pos, snapshot_ss._offset)
+            assert snapshot_ss.name() == our_ss.name()
+            assert snapshot_ss.lexname() == our_ss.lexname()
+            assert snapshot_ss.definition() == our_ss.definition()
+            assert snapshot_ss.examples() == our_ss.examples()
+            assert snapshot_ss._pointers == our_ss._pointers
+            assert snapshot_ss.lemma_names() == our_ss.lemma_names()
+            assert snapshot_ss.frame_ids() == our_ss.frame_ids()
+            assert ([lemma.frame_ids() for lemma in snapshot_ss.lemmas()] ==
+                    [lemma.frame_ids() for lemma in our_ss.lemmas()])
+
+    def test_wordnet_from_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            # The data directory is already loaded, the snapshot is built
+            # from its store.
+            WordNet(wordnet_30_dir, snapshot=filename)
+            assert os.path.exists(filename)
+            snapshot_wn = WordNet(wordnet_30_dir, snapshot=filename)
+        assert snapshot_wn.synsets('dogs') == our_wn.synsets('dogs')
+        assert snapshot_wn.synset('dog.n.01').lemma_names() == ['dog', 'domestic_dog', 'Canis_familiaris']
+
+    def test_stale_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            our_wn.save_snapshot(filename)
+            with self.assertRaises(WordNetError):
+                load_snapshot(filename, wn_data_dir + 'wordnet-3.3/', None)
+            with self.assertRaises(WordNetError):
+                load_snapshot(filename, wordnet_30_dir, 'clusters')
+
+    def test_snapshot_validation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            our_wn.save_snapshot(filename)
+            # The files are only hashed if they look changed or if asked to.
+            with mock.patch('wn.snapshot.source_checksum', side_effect=AssertionError):
+                load_snapshot(filename, wordnet_30_dir, None)
+                with self.assertRaises(AssertionError):
+                    load_snapshot(filename, wordnet_30_dir, None, verify=True)
+            with mock.patch('wn.snapshot.source_stats', return_value=()):
+                load_snapshot(filename, wordnet_30_dir, None)
+            with mock.patch('wn.snapshot.source_stats', return_value=()), \
+                 mock.patch('wn.snapshot.source_checksum', return_value=''):
+                with self.assertRaises(WordNetError):
+                    load_snapshot(filename, wordnet_30_dir, None)
+
+    def test_corrupt_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'wordnet-3.0.snapshot')
+            our_wn.save_snapshot(filename)
+            with open(filename, 'rb') as fin:
+                data = fin.read()
+            header_length, = struct.unpack('<I', data[len(_SNAPSHOT_MAGIC):len(_SNAPSHOT_MAGIC) + 4])
+            header_end = len(_SNAPSHOT_MAGIC) + 4 + header_length
+            for corrupt in [data[:header_end + 1000], data[:header_end] + marshal.dumps([1]),
+                            data[:header_end] + marshal.dumps({'synsets': [(1, 2)],
+                                                               'lemma_pos_offset_map': {},
+                                                               'lemmakey_to_count': {}}),
+                            data[:len(_SNAPSHOT_MAGIC)] + struct.pack('<I', 5) + marshal.dumps(1)]:
+                with open(filename, 'wb') as fout:
+                    fout.write(corrupt)
+                with self.assertRaises(WordNetError):
+                    load_snapshot(filename, wordnet_30_dir, None)
+                # WordNet warns and reads the text files instead.
+                with self.assertWarns(UserWarning):
+                    assert our_wn._load_snapshot(filename) is False
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the per data directory stores.
+"""
+
+import gc
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir, wn_data_dir
+from wn.morphy import morphy
+from wn.store import default_store, get_store, store_key
+
+our_wn = WordNet(wordnet_30_dir)
+wn_33 = WordNet(wn_data_dir + 'wordnet-3.3/', lexname_type='clusters')
+
+class TestStore(unittest.TestCase):
+    def test_shared_store(self):
+        # Opening the same data directory again doesn't reparse it.
+        assert WordNet(wordnet_30_dir)._store is our_wn._store
+        assert WordNet(wordnet_30_dir + '.')._store is our_wn._store
+        assert WordNet(wordnet_30_dir, lazy=True)._store is not our_wn._store
+
+    def test_shared_indexes(self):
+        # An index built through one WordNet is used by all that share its store.
+        other_wn = WordNet(wordnet_30_dir)
+        expected = morphy('geese', 'n', store=other_wn._store)
+        inflection_index = our_wn.build_inflection_index()
+        try:
+            assert other_wn._store.inflection_index is inflection_index
+            assert morphy('geese', 'n', store=other_wn._store) == expected
+        finally:
+            our_wn._store.inflection_index = None
+
+    def test_default_store(self):
+        # The module level functions use the store of the default directory.
+        assert default_store() is our_wn._store
+        assert default_store() is not wn_33._store
+
+    def test_unused_store_freed(self):
+        key = store_key(wordnet_30_dir, 'clusters', 'mmap')
+        wordnet = WordNet(wordnet_30_dir, lexname_type='clusters', mmap=True)
+        assert get_store(key) is wordnet._store
+        del wordnet
+        gc.collect()
+        assert get_store(key) is None
+
+    def test_side_by_side(self):
+        assert wn_33._store is not our_wn._store
+        assert len(list(our_wn.all_synsets())) == 117659
+        assert our_wn.synset('dog.n.01').lexname() == 'noun.animal'
+        assert wn_33.synset('dog.n.01').lexname() == '5'
+        dog = our_wn.synset('dog.n.01')
+        assert dog._store is our_wn._store
+        assert all(ss._store is our_wn._store for ss in dog.hypernyms())
+        assert all(lemma.synset() is dog for lemma in dog.lemmas())
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the streaming synset records.
+"""
+
+import os
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.stream import iter_synset_records
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+lazy_wn = WordNet(wordnet_30_dir, lazy=True)
+
+class TestStream(unittest.TestCase):
+    def test_records(self):
+        n_records = 0
+        for record in iter_synset_records(wordnet_30_dir):
+            synset = our_wn._synset_offset_cache[record.pos][record.offset]
+            assert record.name == synset.name()
+            assert record.lexname == synset.lexname()
+            assert record.lemmas == synset.lemma_names()
+            assert record.definition == synset.definition()
+            assert record.examples == synset.examples()
+            n_records += 1
+        assert n_records == 117659
+
+    def test_cache_untouched(self):
+        # The lazy store is shared with the other tests, which may have
+        # loaded a few synsets already.
+        n_cached = sum(len(cache) for cache in lazy_wn._synset_offset_cache.values())
+        assert n_cached < 117659
+        assert sum(1 for _ in iter_synset_records(wordnet_30_dir, store=lazy_wn._store)) == 117659
+        assert sum(len(cache) for cache in lazy_wn._synset_offset_cache.values()) == n_cached
+
+    def test_selected_fields(self):
+        data_verb = os.path.join(wordnet_30_dir, 'data.verb')
+        selected = iter_synset_records(data_verb, fields=('offset', 'lemmas', 'gloss'))
+        for record, full in zip(selected, iter_synset_records(data_verb)):
+            assert record == full._replace(pos=None, name=None, lexname=None)
+        with self.assertRaises(WordNetError):
+            next(iter_synset_records(data_verb, fields=('offset', 'pointers')))
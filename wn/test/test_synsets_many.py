@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the batch and indexed synset lookups.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+from wn.utils import WordNetError
+
+our_wn = WordNet(wordnet_30_dir)
+
+class TestSynsetsMany(unittest.TestCase):
+    def test_synsets_many(self):
+        tokens = ['The', 'dogs', 'ran', 'the', 'xyzzy', 'Dogs', 'better', 'ran']
+        results = our_wn.synsets_many(tokens)
+        assert results == [our_wn.synsets(token) for token in tokens]
+        assert results[1] is not results[5]
+        pos_tags = ['n', 'n', 'v', None, 'n', 'v', 'a', 'n']
+        assert our_wn.synsets_many(tokens, pos_tags) == [
+            our_wn.synsets(token, pos) for token, pos in zip(tokens, pos_tags)]
+        assert our_wn.synsets_many(iter(tokens), 'v') == [
+            our_wn.synsets(token, 'v') for token in tokens]
+        assert our_wn.synsets_many([]) == []
+        with self.assertRaises(WordNetError):
+            our_wn.synsets_many(tokens, ['n'])
+
+    def test_synset_index(self):
+        forms = ['dog', 'Dogs', 'geese', 'leaves', 'better', 'ran', 'beautiful',
+                 'good', 'xyzzy', 'run', 'hardly']
+        expected = [our_wn.synsets(form) for form in forms]
+        expected_pos = [our_wn.synsets(form, pos) for form in forms for pos in 'nvasr']
+        synset_index = our_wn.build_synset_index()
+        try:
+            assert synset_index['dog'] == tuple(expected[0])
+            assert 'geese' in synset_index and 'dogs' not in synset_index
+            assert [our_wn.synsets(form) for form in forms] == expected
+            assert our_wn.synsets('dog') is not our_wn.synsets('dog')
+            assert [our_wn.synsets(form, pos) for form in forms for pos in 'nvasr'] == expected_pos
+        finally:
+            our_wn._store.synset_index = None
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2020 NLTK Project
+# Author:
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Tests for the verb frames.
+"""
+
+import unittest
+
+from wn import WordNet
+from wn.constants import wordnet_30_dir
+
+our_wn = WordNet(wordnet_30_dir)
+mmap_wn = WordNet(wordnet_30_dir, mmap=True)
+
+class TestVerbFrames(unittest.TestCase):
+    def test_frames(self):
+        for wordnet in [our_wn, mmap_wn]:
+            # Frames with lemma number 0 belong to the synset and all its lemmas.
+            yield_v = wordnet.synset('yield.v.01')
+            assert yield_v.frame_ids() == [11]
+            assert [lemma.frame_strings() for lemma in yield_v.lemmas()] == [
+                ['Something yield something'], ['Something give something'],
+                ['Something afford something']]
+            # The others only to their lemma.
+            cost_v = wordnet.synset('cost.v.01')
+            assert cost_v.frame_ids() == [11]
+            assert wordnet.lemma('cost.v.01.cost').frame_ids() == [11, 14]
+            assert wordnet.lemma('cost.v.01.be').frame_ids() == [11]
+            assert wordnet.synset('dog.n.01').frame_ids() == []
+            assert wordnet.lemma('dog.n.01.dog').frame_strings() == []
+
+    def test_lemmas_with_frame(self):
+        lemmas = our_wn.lemmas_with_frame(26)
+        assert lemmas == [lemma for synset in our_wn.all_synsets('v')
+                          for lemma in synset.lemmas() if 26 in lemma.frame_ids()]
+        assert mmap_wn.lemmas_with_frame(26) == lemmas
+        assert our_wn.lemmas_with_frame(99) == []
@@ -45,6 +45,7 @@ class FakeSynset:
 
 class WordNetObject(object):
     """A common base class for lemmas and synsets."""
+    __slots__ = ()
 
     def hypernyms(self):
         return self._related('@')
@@ -161,3 +162,20 @@ def per_chunk(iterable, n=1, fillvalue=None):
     """
     args = [iter(iterable)] * n
     return zip_longest(*args, fillvalue=fillvalue)
+
+
+def split_gloss(gloss):
+    """
+    Same as `wn.reader.parse_gloss()`, with `str.split()` instead of
+    regexes: the odd parts between the double quotes are the examples,
+    except for the text after an unmatched last quote, which stays in the
+    definition.
+    """
+    parts = gloss.split('"')
+    if len(parts) % 2:
+        examples = parts[1::2]
+        definition = ''.join(parts[0::2])
+    else:
+        examples = parts[1:-1:2]
+        definition = ''.join(parts[0:-1:2]) + '"' + parts[-1]
+    return definition.strip(';, '), examples